@@ -9,15 +9,15 @@ Special error handling is included for CLI-specific errors.
 import argparse
 import json
 import sys
+from collections.abc import Callable
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .color import Color
 from .errors import CalctlError
 from .models import Event
-from .service import CalendarService
-from .store import JsonEventStore
 
 
 def default_data_path() -> Path:
@@ -29,38 +29,7 @@ def default_data_path() -> Path:
     '''
     return Path.home() / ".calctl" / "events.json"
 
-def build_parser() -> argparse.ArgumentParser:
-    '''
-    Build the argument parser for the command-line interface.
-
-    Returns:
-        argparse.ArgumentParser: The argument parser for the command-line interface.
-    '''
-    examples = """Examples:
-    calctl add --title "Meeting" --date 2024-03-15 --time 14:00 --duration 60
-    calctl add --title "Standup" --date 2024-03-15 --time 10:00 --duration 30 --repeat weekly --count 4
-    calctl list --today
-    calctl agenda --week
-    calctl search "meeting"
-    calctl delete evt-8a2f --dry-run
-    """
-
-    p = argparse.ArgumentParser(
-        prog="calctl",
-        description="calctl - A command-line calendar manager",
-        epilog=examples,
-        formatter_class=argparse.RawTextHelpFormatter,
-    )
-    p.add_argument("-v", "--version", action="version", version="calctl 0.1.0")
-    p.add_argument("--no-color", action="store_true", help="Disable colored output")
-
-    fmt = p.add_mutually_exclusive_group()
-    fmt.add_argument("--json", action="store_true", help="Output in JSON format")
-    fmt.add_argument("--plain", action="store_true", help="Output in plain text (default)")
-
-    sub = p.add_subparsers(dest="cmd")
-
-    add = sub.add_parser("add", help="Add a new event")
+def _setup_add(add: argparse.ArgumentParser) -> None:
     add.add_argument("--title", required=True)
     add.add_argument("--date", required=True)
     add.add_argument("--time", required=True)
@@ -71,8 +40,7 @@ def build_parser() -> argparse.ArgumentParser:
     add.add_argument("--repeat", choices=["daily", "weekly"], help="Create recurring events")
     add.add_argument("--count", type=int, default=1, help="Number of occurrences (used with --repeat)")
 
-
-    listp = sub.add_parser("list", help="List events")
+def _setup_list(listp: argparse.ArgumentParser) -> None:
     # mutually exclusive: --today vs --week vs --from/--to（range）
     g = listp.add_mutually_exclusive_group()
     g.add_argument("--today", action="store_true", help="List today's events")
@@ -80,17 +48,17 @@ def build_parser() -> argparse.ArgumentParser:
     listp.add_argument("--from", dest="from_date", help="Start date (YYYY-MM-DD)")
     listp.add_argument("--to", dest="to_date", help="End date (YYYY-MM-DD)")
 
-    show = sub.add_parser("show", help="Show event details")
+def _setup_show(show: argparse.ArgumentParser) -> None:
     show.add_argument("id")
 
-    deletep = sub.add_parser("delete", help="Delete event(s)")
+def _setup_delete(deletep: argparse.ArgumentParser) -> None:
     target = deletep.add_mutually_exclusive_group(required=True)
     target.add_argument("id", nargs="?", help="Event id to delete (e.g., evt-8a2f)")
     target.add_argument("--date", dest="date", help="Delete all events on date (YYYY-MM-DD)")
     deletep.add_argument("--force", action="store_true", help="Skip confirmation")
     deletep.add_argument("--dry-run", action="store_true", help="Show what would be deleted")
 
-    editp = sub.add_parser("edit", help="Edit an existing event")
+def _setup_edit(editp: argparse.ArgumentParser) -> None:
     editp.add_argument("id", help="Event id (e.g., evt-8a2f)")
     editp.add_argument("--title")
     editp.add_argument("--description")
@@ -99,15 +67,88 @@ def build_parser() -> argparse.ArgumentParser:
     editp.add_argument("--duration", type=int)
     editp.add_argument("--location")
 
-    searchp = sub.add_parser("search", help="Search events by title/description/etc.")
+def _setup_search(searchp: argparse.ArgumentParser) -> None:
     searchp.add_argument("query", help="Search phrase (case-insensitive, partial match)")
     searchp.add_argument("--title", action="store_true", help="Search only in titles")
 
-    agp = sub.add_parser("agenda", help="Show agenda view (today, week, or a specific date)")
+def _setup_agenda(agp: argparse.ArgumentParser) -> None:
     mx = agp.add_mutually_exclusive_group()
     mx.add_argument("--week", action="store_true", help="Show this week's agenda (Sun-Sat)")
     mx.add_argument("--date", help="Show agenda for a specific date (YYYY-MM-DD)")
 
+# command name -> (help text, function adding the command's arguments)
+SUBCOMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "add": ("Add a new event", _setup_add),
+    "list": ("List events", _setup_list),
+    "show": ("Show event details", _setup_show),
+    "delete": ("Delete event(s)", _setup_delete),
+    "edit": ("Edit an existing event", _setup_edit),
+    "search": ("Search events by title/description/etc.", _setup_search),
+    "agenda": ("Show agenda view (today, week, or a specific date)", _setup_agenda),
+}
+
+def requested_command(argv: list[str]) -> str | None:
+    '''
+    Return the subcommand named on the command line, if any.
+
+    The global options take no values, so the first argument that is not
+    an option names the command.
+
+    Args:
+        argv: The command-line arguments, without the program name.
+
+    Returns:
+        str | None: The command, or None if no known command is given.
+    '''
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg if arg in SUBCOMMANDS else None
+    return None
+
+@lru_cache(maxsize=len(SUBCOMMANDS) + 1)  # one per command, plus the full parser
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    '''
+    Build the argument parser for the command-line interface.
+
+    Every subcommand is registered so that usage and errors list them all,
+    but only the arguments of `command` are set up when it is given; with
+    no command the complete parser is built. Parsers are built once per
+    command and shared; parse_args does not modify them.
+
+    Args:
+        command: The only subcommand whose arguments are needed, or None for all.
+
+    Returns:
+        argparse.ArgumentParser: The argument parser for the command-line interface.
+    '''
+    examples = """Examples:
+    calctl add --title "Meeting" --date 2024-03-15 --time 14:00 --duration 60
+    calctl add --title "Standup" --date 2024-03-15 --time 10:00 --duration 30 --repeat weekly --count 4
+    calctl list --today
+    calctl agenda --week
+    calctl search "meeting"
+    calctl delete evt-8a2f --dry-run
+    """
+
+    p = argparse.ArgumentParser(
+        prog="calctl",
+        description="calctl - A command-line calendar manager",
+        epilog=examples,
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p.add_argument("-v", "--version", action="version", version="calctl 0.1.0")
+    p.add_argument("--no-color", action="store_true", help="Disable colored output")
+
+    fmt = p.add_mutually_exclusive_group()
+    fmt.add_argument("--json", action="store_true", help="Output in JSON format")
+    fmt.add_argument("--plain", action="store_true", help="Output in plain text (default)")
+
+    sub = p.add_subparsers(dest="cmd")
+    for name, (help_text, setup) in SUBCOMMANDS.items():
+        subp = sub.add_parser(name, help=help_text)
+        if command is None or command == name:
+            setup(subp)
+
     return p
 
 def event_to_dict(e: Event) -> dict[str, Any]:
@@ -196,8 +237,10 @@ def main() -> None:
     Returns:
         None
     '''
-    parser = build_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    # only the requested command's arguments are needed
+    parser = build_parser(requested_command(argv))
+    args = parser.parse_args(argv)
 
     use_color = not args.no_color
     c_out = Color(use_color, stream="stdout")
@@ -207,6 +250,11 @@ def main() -> None:
         parser.print_help()
         raise SystemExit(0)
 
+    # imported here so that building the parser (and --help) does not load
+    # the service/store modules and their JSON backend
+    from .service import CalendarService
+    from .store import JsonEventStore
+
     store = JsonEventStore(default_data_path())
     svc = CalendarService(store)
 
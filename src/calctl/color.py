@@ -1,5 +1,27 @@
 # src/calctl/color.py
 import sys
+from collections.abc import Callable
+
+_RESET = "\033[0m"
+
+
+def _plain(text: str) -> str:
+    return text
+
+
+def _painter(code: str) -> Callable[[str], str]:
+    prefix = f"\033[{code}m"
+
+    def paint(text: str) -> str:
+        return f"{prefix}{text}{_RESET}"
+
+    return paint
+
+
+_GREEN = _painter("32")
+_RED = _painter("31")
+_YELLOW = _painter("33")
+_BOLD = _painter("1")
 
 
 class Color:
@@ -7,25 +29,27 @@ class Color:
     Minimal ANSI color helper.
     - enabled: controlled by --no-color
     - only colorize when output is a TTY (avoid polluting redirected output)
+    - green/red/yellow/bold are rebound whenever `enabled` changes, so a
+      call never has to check the flag
     """
+    green: Callable[[str], str]
+    red: Callable[[str], str]
+    yellow: Callable[[str], str]
+    bold: Callable[[str], str]
+
     def __init__(self, enabled: bool, *, stream: str = "stdout"):
         is_tty = sys.stderr.isatty() if stream == "stderr" else sys.stdout.isatty()
 
         self.enabled = enabled and is_tty
 
-    def _wrap(self, text: str, code: str) -> str:
-        if not self.enabled:
-            return text
-        return f"\033[{code}m{text}\033[0m"
-
-    def green(self, text: str) -> str:
-        return self._wrap(text, "32")
-
-    def red(self, text: str) -> str:
-        return self._wrap(text, "31")
-
-    def yellow(self, text: str) -> str:
-        return self._wrap(text, "33")
-
-    def bold(self, text: str) -> str:
-        return self._wrap(text, "1")
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        if value:
+            self.green, self.red, self.yellow, self.bold = _GREEN, _RED, _YELLOW, _BOLD
+        else:
+            self.green = self.red = self.yellow = self.bold = _plain
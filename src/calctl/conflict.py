@@ -6,6 +6,9 @@ This module provides functions to detect conflicts between calendar events.
 
 from __future__ import annotations  # for type hints
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+
 from .models import Event
 
 
@@ -17,11 +20,85 @@ def overlaps(a: Event, b: Event) -> bool:
         a: The first event.
         b: The second event.
     '''
+    # only compare if on same date (your model is date-based); most pairs
+    # differ here, so test it first, on the cached integer ordinals
+    if a._ord != b._ord:
+        return False
     # same event id should not compare
     if a.id == b.id:
         return False
-    # only compare if on same date (your model is date-based)
-    if a.date != b.date:
-        return False
-    # interval overlap: [start, end)
-    return a.start_dt() < b.end_dt() and b.start_dt() < a.end_dt()
+    # interval overlap: [start, end), using the minutes cached on Event
+    return a._start_min < b._end_min and b._start_min < a._end_min
+
+
+class IntervalIndex:
+    '''
+    Per-date index of events for overlap queries.
+
+    Events of each date are kept sorted by start minute, together with a
+    running maximum of their end minutes. A query bisects both: events
+    starting at or after the queried end cannot overlap, and neither can
+    any prefix whose latest end is at or before the queried start. Only
+    the window in between is scanned.
+    '''
+    def __init__(self, events: Iterable[Event] = ()):
+        # date ordinal -> parallel sequences sorted by start minute
+        self._starts: dict[int, list[int]] = {}
+        self._ends: dict[int, list[int]] = {}
+        self._max_ends: dict[int, list[int]] = {}  # max(ends[0..i])
+        self._events: dict[int, list[Event]] = {}
+        for e in events:
+            self.add(e)
+
+    def add(self, e: Event) -> None:
+        '''
+        Add an event to the index.
+
+        Args:
+            e: The event to add.
+        '''
+        start, end = e._start_min, e._end_min
+        starts = self._starts.get(e._ord)
+        if starts is None:
+            starts = self._starts[e._ord] = []
+            self._ends[e._ord] = []
+            self._max_ends[e._ord] = []
+            self._events[e._ord] = []
+        i = bisect_right(starts, start)
+        starts.insert(i, start)
+        ends = self._ends[e._ord]
+        ends.insert(i, end)
+        self._events[e._ord].insert(i, e)
+        # refresh the running maximum from the insertion point on
+        max_ends = self._max_ends[e._ord]
+        max_ends.insert(i, 0)
+        running = max_ends[i - 1] if i else 0
+        for j in range(i, len(ends)):
+            running = max(running, ends[j])
+            max_ends[j] = running
+
+    def overlapping(self, e: Event) -> list[Event]:
+        '''
+        Return the indexed events that overlap the given event.
+
+        Args:
+            e: The event to check.
+
+        Returns:
+            list[Event]: Overlapping events (never e itself), ordered by start time.
+        '''
+        starts = self._starts.get(e._ord)
+        if not starts:
+            return []
+        start, end = e._start_min, e._end_min
+        ends = self._ends[e._ord]
+        events = self._events[e._ord]
+        # only events starting before e ends can overlap it: [start, end)
+        hi = bisect_left(starts, end)
+        # events before lo all end at or before e starts
+        lo = bisect_right(self._max_ends[e._ord], start, 0, hi)
+        # zip walks the window without per-item index lookups
+        return [
+            ev for ev_end, ev in zip(ends[lo:hi], events[lo:hi], strict=True)
+            if ev_end > start and ev.id != e.id
+        ]
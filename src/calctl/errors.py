@@ -1,6 +1,16 @@
+import sys
+
+
 class CalctlError(Exception):
     exit_code = 1
 
+    def __init__(self, *args: object) -> None:
+        # short messages are interned, so repeats of the same error share
+        # one string and compare by identity
+        if len(args) == 1 and type(args[0]) is str and len(args[0]) < 64:
+            args = (sys.intern(args[0]),)
+        super().__init__(*args)
+
 class InvalidInputError(CalctlError):
     exit_code = 2
 
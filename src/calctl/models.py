@@ -6,13 +6,14 @@ application. These models represent valid domain objects and contain
 no I/O or CLI-related logic.
 '''
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 
 
 # @dataclass generate __init__ method, __repr__, __eq__, __hash__, __str__ methods
 # frozen=True makes the class immutable
-@dataclass(frozen=True)
+# slots=True drops the per-instance __dict__ (smaller events, faster attribute access)
+@dataclass(frozen=True, slots=True)
 class Event:
     '''
     Represents a single calendar event.
@@ -32,6 +33,42 @@ class Event:
     create_at: datetime
     update_at: datetime
 
+    # lowercased search text, computed once: the title alone, and all
+    # searchable fields joined by spaces (queries may span fields)
+    _ci_title: str = field(init=False, repr=False, compare=False)
+    _ci_text: str = field(init=False, repr=False, compare=False)
+    # proleptic Gregorian ordinal of `date`, for cheap integer comparisons
+    _ord: int = field(init=False, repr=False, compare=False)
+    # [start, end) interval in minutes since midnight
+    _start_min: int = field(init=False, repr=False, compare=False)
+    _end_min: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        '''
+        Normalize the text fields and cache derived values.
+
+        Leading/trailing whitespace is stripped from title, description and
+        location, and the lowercased search text, the date ordinal and the
+        start/end minutes are cached. Since the class is frozen, attributes are set through
+        object.__setattr__.
+        '''
+        title = self.title.strip()
+        description = self.description.strip() if self.description is not None else None
+        location = self.location.strip() if self.location is not None else None
+        object.__setattr__(self, "title", title)
+        object.__setattr__(self, "description", description)
+        object.__setattr__(self, "location", location)
+        object.__setattr__(self, "_ci_title", title.lower())
+        object.__setattr__(self, "_ci_text", " ".join((
+            self.id, title, description or "", location or "",
+            self.date.isoformat(), self.start_time, str(self.duration_min),
+        )).lower())
+        object.__setattr__(self, "_ord", self.date.toordinal())
+        hh, _, mm = self.start_time.partition(":")
+        start_min = int(hh) * 60 + int(mm)
+        object.__setattr__(self, "_start_min", start_min)
+        object.__setattr__(self, "_end_min", start_min + self.duration_min)
+
     def start_dt(self) -> datetime:
         """
         Compute the start datetime of the event.
@@ -5,15 +5,46 @@ This module contains the business logic for the calendar application.
 It handles the interaction between the CLI and the data store.
 '''
 
+import re
+import sys
+from bisect import bisect_left, bisect_right
 from dataclasses import replace
 from datetime import date, datetime, timedelta
 from secrets import token_hex
 
-from .conflict import overlaps
+from .conflict import IntervalIndex, overlaps
 from .errors import ConflictError, InvalidInputError, NotFoundError
 from .models import Event
 from .store import JsonEventStore
 
+# compiled once; used by the input parsers below
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+_TIME_RE = re.compile(r"([0-9]{1,2}):([0-9]{1,2})")
+
+
+def _ord_key(e: Event) -> int:
+    return e._ord
+
+
+def _date_slice(events: list[Event], first: int, last: int) -> list[Event]:
+    '''
+    Return the events whose date ordinal lies in [first, last].
+
+    store.list_all() returns events sorted by date, so the bounds are found
+    by binary search instead of testing every event.
+
+    Args:
+        events: Events sorted by date.
+        first: The first date ordinal to include.
+        last: The last date ordinal to include.
+
+    Returns:
+        list[Event]: The matching slice of events.
+    '''
+    lo = bisect_left(events, first, key=_ord_key)
+    hi = bisect_right(events, last, lo=lo, key=_ord_key)
+    return events[lo:hi]
+
 
 class CalendarService:
     '''
@@ -24,6 +55,8 @@ class CalendarService:
     '''
     def __init__(self, store: JsonEventStore):
         self.store = store
+        # parsed dates by input string, so equal dates share one object
+        self._date_pool: dict[str, date] = {}
 
     def add_event(self,
             title: str,
@@ -54,9 +87,8 @@ class CalendarService:
         Returns:
             list[Event]: A list of events.
         '''
-        # parse and validate input arguments
-        title = (title or "").strip()
-        if not title:
+        # parse and validate input arguments (Event strips the text fields)
+        if not (title or "").strip():
             raise InvalidInputError("Title is required")
 
         d = self._parse_date(date_str)
@@ -64,6 +96,11 @@ class CalendarService:
         dur = self._validate_duration(duration)
         now = datetime.now()
 
+        # every occurrence shares the start time and duration, so check once;
+        # ending exactly at 24:00 already lands on the next day
+        if int(t[:2]) * 60 + int(t[3:5]) + dur >= 24 * 60:
+            raise InvalidInputError("Event cannot cross midnight (duration too long)")
+
         if repeat is None:
             count = 1
             step = timedelta(days=0)
@@ -74,47 +111,43 @@ class CalendarService:
                 raise InvalidInputError('--repeat must be "daily" or "weekly"')
             step = timedelta(days=1) if repeat == "daily" else timedelta(weeks=1)
 
-        new_events: list[Event] = []
+        description = description or None
+        location = location or None
+        # only stored events within the occurrences' date range can collide
+        index = None if force else IntervalIndex(_date_slice(
+            self.store.list_all(), d.toordinal(), (d + step * (count - 1)).toordinal()))
 
+        # build, conflict-check and collect each occurrence in one pass
+        new_events: list[Event] = []
+        conflicts: list[tuple[Event, Event]] = []
         for i in range(count):
-            di = d + (step * i)
-            e = Event(
+            ne = Event(
                 id=self._new_event_id(),
                 title=title,
-                description=(description.strip() if description else None),
-                date=di,
+                description=description,
+                date=d + step * i,
                 start_time=t,
                 duration_min=dur,
-                location=(location.strip() if location else None),
+                location=location,
                 create_at=now,
                 update_at=now,
             )
+            if index is not None:
+                conflicts.extend((ne, ex) for ex in index.overlapping(ne))
+                # later occurrences of the batch are checked against this one too
+                index.add(ne)
+            new_events.append(ne)
 
-
-            if e.end_dt().date() != e.start_dt().date():
-                raise InvalidInputError("Event cannot cross midnight (duration too long)")
-
-            new_events.append(e)
-
-        if not force:
-            existing = self.store.list_all()
-
-            conflicts: list[tuple[Event, Event]] = []
-            for ne in new_events:
-                for ex in existing:
-                    if overlaps(ne, ex):
-                        conflicts.append((ne, ex))
-
-            if conflicts:
-                lines = ["Event conflicts with existing events:"]
-                for (ne, ex) in conflicts:
-                    lines.append(
-                        f'- New "{ne.title}" on {ne.date.isoformat()} '
-                        f'({ne.start_time}-{ne.end_dt().strftime("%H:%M")}) '
-                        f'conflicts with "{ex.title}" ({ex.start_time}-{ex.end_dt().strftime("%H:%M")})'
-                    )
-                lines.append("Use --force to schedule anyway.")
-                raise ConflictError("\n".join(lines))
+        if conflicts:
+            lines = ["Event conflicts with existing events:"]
+            for (ne, ex) in conflicts:
+                lines.append(
+                    f'- New "{ne.title}" on {ne.date.isoformat()} '
+                    f'({ne.start_time}-{ne.end_dt().strftime("%H:%M")}) '
+                    f'conflicts with "{ex.title}" ({ex.start_time}-{ex.end_dt().strftime("%H:%M")})'
+                )
+            lines.append("Use --force to schedule anyway.")
+            raise ConflictError("\n".join(lines))
 
         self.store.add_many(new_events)
         return new_events
@@ -139,26 +172,26 @@ class CalendarService:
         '''
         events = self.store.list_all()
         today = date.today()
+        today_ord = today.toordinal()
 
+        # filters are date ranges over the date-sorted snapshot
         if today_only:
-            return [e for e in events if e.date == today]
+            return _date_slice(events, today_ord, today_ord)
 
         if week:
             # week starts on Sunday
             # Python weekday(): Mon=0 ... Sun=6
             days_since_sun = (today.weekday() + 1) % 7
-            week_start = today - timedelta(days=days_since_sun)
-            week_end = week_start + timedelta(days=6)
-            return [e for e in events if week_start <= e.date <= week_end]
+            start_ord = today_ord - days_since_sun
+            end_ord = start_ord + 6
+            return _date_slice(events, start_ord, end_ord)
 
         if from_date is not None or to_date is not None:
-            if from_date is None:
-                from_date = date.min
-            if to_date is None:
-                to_date = date.max
-            return [e for e in events if from_date <= e.date <= to_date]
+            from_ord = (from_date or date.min).toordinal()
+            to_ord = (to_date or date.max).toordinal()
+            return _date_slice(events, from_ord, to_ord)
 
-        return [e for e in events if e.date >= today]
+        return _date_slice(events, today_ord, date.max.toordinal())
 
     def show_event(self, event_id: str) -> Event:
         '''
@@ -176,8 +209,20 @@ class CalendarService:
         return e
 
     def show_event_with_conflicts(self, event_id: str) -> tuple[Event, list[Event]]:
-        e = self.show_event(event_id)
+        '''
+        Show an event by its id together with the events it overlaps.
+
+        Args:
+            event_id: The id of the event.
+
+        Returns:
+            tuple[Event, list[Event]]: The event and its conflicts.
+        '''
+        # one store read: look the event up in the same snapshot used for conflicts
         all_events = self.store.list_all()
+        e = next((x for x in all_events if x.id == event_id), None)
+        if e is None:
+            raise NotFoundError(f"Event with id {event_id} not found")
         conflicts = [x for x in all_events if overlaps(e, x)]
         conflicts.sort(key=lambda x: (x.date.isoformat(), x.start_time, x.id))
         return e, conflicts
@@ -212,9 +257,8 @@ class CalendarService:
         Returns:
             list[Event]: A list of events.
         '''
-        d = self._parse_date(date_str)
-        events = [e for e in self.store.list_all() if e.date == d]
-        return events
+        d_ord = self._parse_date(date_str).toordinal()
+        return _date_slice(self.store.list_all(), d_ord, d_ord)
 
     def delete_on_date(self, date_str: str) -> int:
         '''
@@ -227,7 +271,8 @@ class CalendarService:
             int: The number of events deleted.
         '''
         d = self._parse_date(date_str)
-        return self.store.delete_by_date(d.isoformat())
+        deleted = self.store.delete_by_date(d.isoformat())
+        return deleted
 
     def parse_date(self, s: str) -> date:
         """Public wrapper for date parsing"""
@@ -264,13 +309,13 @@ class CalendarService:
         if all(v is None for v in [title, description, date_str, time_str, duration, location]):
             raise InvalidInputError("No fields provided to edit")
 
-        # Normalize / parse inputs (only if provided)
-        new_title = old.title if title is None else title.strip()
-        if title is not None and not new_title:
+        # Normalize / parse inputs (only if provided); Event strips the text fields
+        if title is not None and not title.strip():
             raise InvalidInputError("Title cannot be empty")
+        new_title = old.title if title is None else title
 
-        new_desc = old.description if description is None else (description.strip() if description else None)
-        new_loc = old.location if location is None else (location.strip() if location else None)
+        new_desc = old.description if description is None else (description or None)
+        new_loc = old.location if location is None else (location or None)
 
         new_date = old.date if date_str is None else self._parse_date(date_str)
         new_time = old.start_time if time_str is None else self._normalize_time(time_str)
@@ -289,8 +334,26 @@ class CalendarService:
             update_at=now,
         )
 
+        # Build diff
+        changes: dict[str, tuple[object, object]] = {}
+        def add_change(field: str, before: object, after: object) -> None:
+            if before != after:
+                changes[field] = (before, after)
+
+        add_change("title", old.title, updated.title)
+        add_change("description", old.description, updated.description)
+        add_change("date", old.date.isoformat(), updated.date.isoformat())
+        add_change("start_time", old.start_time, updated.start_time)
+        add_change("duration_min", old.duration_min, updated.duration_min)
+        add_change("location", old.location, updated.location)
+
+        # Nothing actually changed: keep the stored event (and its
+        # update_at) as is and skip the file rewrite
+        if not changes:
+            return old, changes
+
         # Optional: forbid crossing midnight for simplicity
-        if updated.end_dt().date() != updated.start_dt().date():
+        if updated._end_min >= 24 * 60:
             raise InvalidInputError("Event cannot cross midnight (duration too long)")
 
         # Conflict validation: updated event must not overlap with any other event
@@ -306,19 +369,6 @@ class CalendarService:
         # Persist
         self.store.update(updated)
 
-        # Build diff
-        changes: dict[str, tuple[object, object]] = {}
-        def add_change(field: str, before: object, after: object) -> None:
-            if before != after:
-                changes[field] = (before, after)
-
-        add_change("title", old.title, updated.title)
-        add_change("description", old.description, updated.description)
-        add_change("date", old.date.isoformat(), updated.date.isoformat())
-        add_change("start_time", old.start_time, updated.start_time)
-        add_change("duration_min", old.duration_min, updated.duration_min)
-        add_change("location", old.location, updated.location)
-
         return updated, changes
 
     def search_events(self, query: str, *, title_only: bool = False) -> list[Event]:
@@ -328,26 +378,19 @@ class CalendarService:
 
         events = self.store.list_all()
 
-        def haystack(e: Event) -> str:
-            if title_only:
-                return (e.title or "").lower()
-            parts = [
-                e.id,
-                e.title or "",
-                e.description or "",
-                e.location or "",
-                e.date.isoformat(),
-                e.start_time,
-                str(e.duration_min),
-            ]
-            return " ".join(parts).lower()
-
-        matched = [e for e in events if q in haystack(e)]
+        # Event keeps the lowercased haystack (id, title, description,
+        # location, date, time and duration joined by spaces), so a query
+        # can span fields and each check is one substring test
+        if title_only:
+            matched = [e for e in events if q in e._ci_title]
+        else:
+            matched = [e for e in events if q in e._ci_text]
         matched.sort(key=lambda e: (e.date.isoformat(), e.start_time, e.id))
         return matched
 
     def agenda_day(self, d: date) -> list[Event]:
-        events = [e for e in self.store.list_all() if e.date == d]
+        d_ord = d.toordinal()
+        events = _date_slice(self.store.list_all(), d_ord, d_ord)
         events.sort(key=lambda e: (e.start_time, e.id))
         return events
 
@@ -360,9 +403,20 @@ class CalendarService:
         week_start = anchor - timedelta(days=days_since_sun)
 
         week: dict[date, list[Event]] = {}
+        buckets: dict[int, list[Event]] = {}
         for i in range(7):
             d = week_start + timedelta(days=i)
-            week[d] = self.agenda_day(d)
+            week[d] = buckets[d.toordinal()] = []
+
+        # single pass over the week's slice instead of one scan per day
+        start_ord = week_start.toordinal()
+        for e in _date_slice(self.store.list_all(), start_ord, start_ord + 6):
+            bucket = buckets.get(e._ord)
+            if bucket is not None:
+                bucket.append(e)
+
+        for bucket in buckets.values():
+            bucket.sort(key=lambda e: (e._start_min, e.id))
         return week
 
     def parse_date_public(self, s: str) -> date:
@@ -392,11 +446,19 @@ class CalendarService:
             date: A date object.
         '''
         s = (s or "").strip()
+        d = self._date_pool.get(s)
+        if d is not None:
+            return d
+        # expects YYYY-MM-DD
+        m = _DATE_RE.fullmatch(s)
         try:
-            # expects YYYY-MM-DD
-            return date.fromisoformat(s)
+            if m is None:
+                raise ValueError(s)
+            d = date(int(m[1]), int(m[2]), int(m[3]))
         except ValueError:
             raise InvalidInputError(f'Invalid date format "{s}" (expected YYYY-MM-DD)') from None
+        self._date_pool[s] = d
+        return d
 
     def _normalize_time(self, s: str) -> str:
         '''
@@ -409,12 +471,11 @@ class CalendarService:
             str: A normalized time string.
         '''
         s = (s or "").strip()
-        try:
-            dt = datetime.strptime(s, "%H:%M")
-            # normalize to zero-padded HH:MM
-            return dt.strftime("%H:%M")
-        except ValueError:
-            raise InvalidInputError(f'Invalid time format "{s}" (expected HH:MM 24-hour)') from None
+        m = _TIME_RE.fullmatch(s)
+        if m is None or int(m[1]) > 23 or int(m[2]) > 59:
+            raise InvalidInputError(f'Invalid time format "{s}" (expected HH:MM 24-hour)')
+        # normalize to zero-padded HH:MM; interned so equal times share one string
+        return sys.intern(f"{int(m[1]):02d}:{int(m[2]):02d}")
 
     def _validate_duration(self, duration: int) -> int:
         '''
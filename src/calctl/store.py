@@ -8,29 +8,87 @@ It handles the serialization and deserialization of event data to and from JSON.
 from __future__ import annotations
 
 import json
+import os
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .errors import InvalidInputError, StorageError
 from .models import Event
 
+# orjson is an optional speedup (pip install "calctl[fast]"); the file
+# format is the same either way: UTF-8 JSON indented by two spaces
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# a store holds few distinct dates and timestamps that are parsed again
+# on every read; date and datetime are immutable, so sharing them is safe
+@lru_cache(maxsize=4096)
+def _parse_date(s: str) -> date:
+    return date.fromisoformat(s)
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(s: str) -> datetime:
+    return datetime.fromisoformat(s)
+
+
+def _optional_str(value: Any) -> str | None:
+    # hand-edited files may hold numbers in the optional text fields
+    return None if value is None else str(value)
+
+
+def _sort_key(d: dict[str, Any]) -> tuple[str, str, str]:
+    # list_all order: ISO date strings sort like the dates themselves;
+    # tolerate broken entries here, _event_from_dict reports them
+    return (str(d.get("date", "")), str(d.get("start_time", "")), str(d.get("id", "")))
+
 
 class JsonEventStore:
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, *, fsync: bool = False):
         self.path = path
+        # opt-in: flush each save to disk before the rename
+        self.fsync = fsync
+        # parsed file content, valid while revision() == _cache_rev
+        self._cache: dict[str, list[dict[str, Any]]] | None = None
+        self._cache_rev: tuple[int, int, int] | None = None
+        # event id -> position in _cache["events"]
+        self._id_index: dict[str, int] = {}
+        # Events built from _cache["events"], created on first list_all
+        self._events: list[Event] | None = None
 
     def list_all(self) -> list[Event]:
         '''
         List all events in the store.
 
+        Events are kept sorted by date, start time and id, both in the file
+        and in the cache, so no sorting happens here. Events are immutable,
+        so the ones built from the cached content are reused until the file
+        changes.
+
         Returns:
             list[Event]: A list of all events in the store.
         '''
-        data = self._load_data()
-        events = [self._event_from_dict(e) for e in data["events"]]
-        events.sort(key=lambda e: (e.date.isoformat(), e.start_time, e.id))
-        return events
+        data = self._cached()
+        if self._events is None:
+            self._events = [self._event_from_dict(e) for e in data["events"]]
+        return list(self._events)
 
     def get_by_id(self, event_id: str) -> Event | None:
         '''
@@ -42,10 +100,9 @@ class JsonEventStore:
         Returns:
             Event | None: The event or None if not found.
         '''
-        for e in self._load_data()["events"]:
-            if e["id"] == event_id:
-                return self._event_from_dict(e)
-        return None
+        events = self._cached()["events"]
+        i = self._id_index.get(event_id)
+        return None if i is None else self._event_from_dict(events[i])
 
     def add(self, event:Event) -> None:
         '''
@@ -55,21 +112,32 @@ class JsonEventStore:
             event: The event to add.
         '''
         data = self._load_data()
-        if any(e["id"] == event.id for e in data["events"]):
+        if event.id in self._id_index:
             raise StorageError(f"Event with id {event.id} already exists") from None
         data["events"].append(self._event_to_dict(event))
         self._save_data(data)
 
     def add_many(self, events: list[Event]) -> None:
-        data = self._load_data()
-        existing_ids = {d.get("id") for d in data["events"]}
+        '''
+        Add several events to the store with a single write.
+
+        All ids are checked before anything is added, so either every event
+        is stored or none is.
 
+        Args:
+            events: The events to add.
+        '''
+        if not events:
+            return
+        data = self._load_data()
+        existing_ids = self._id_index
+        new_ids: set[str] = set()
         for e in events:
-            if e.id in existing_ids:
+            if e.id in existing_ids or e.id in new_ids:
                 raise StorageError(f'Duplicate event id "{e.id}"') from None
-            data["events"].append(self._event_to_dict(e))
-            existing_ids.add(e.id)
+            new_ids.add(e.id)
 
+        data["events"].extend(self._event_to_dict(e) for e in events)
         self._save_data(data)
 
     def update(self, event:Event) -> None:
@@ -80,12 +148,11 @@ class JsonEventStore:
             event: The event to update.
         '''
         data = self._load_data()
-        for i, e in enumerate(data["events"]):
-            if e["id"] == event.id:
-                data["events"][i] = self._event_to_dict(event)
-                self._save_data(data)
-                return
-        raise StorageError(f"Event with id {event.id} not found") from None
+        i = self._id_index.get(event.id)
+        if i is None:
+            raise StorageError(f"Event with id {event.id} not found") from None
+        data["events"][i] = self._event_to_dict(event)
+        self._save_data(data)
 
     def delete_by_id(self, event_id: str) -> bool:
         '''
@@ -98,12 +165,12 @@ class JsonEventStore:
             bool: True if the event was deleted, False otherwise.
         '''
         data = self._load_data()
-        for i, e in enumerate(data["events"]):
-            if e["id"] == event_id:
-                del data["events"][i]
-                self._save_data(data)
-                return True
-        return False
+        i = self._id_index.get(event_id)
+        if i is None:
+            return False
+        del data["events"][i]
+        self._save_data(data)
+        return True
 
     def delete_by_date(self, date_str: str) -> int:
         '''
@@ -128,6 +195,24 @@ class JsonEventStore:
             self._save_data(data)
         return deleted
 
+    def revision(self) -> tuple[int, int, int] | None:
+        '''
+        Return a cheap token that changes whenever the data file is rewritten.
+
+        Saves replace the file, so the inode, size and modification time
+        together identify one version of it without reading the content.
+
+        Returns:
+            tuple[int, int, int] | None: The token, or None if the file does not exist.
+        '''
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            raise StorageError(f"Failed to stat file: {e}") from None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
 
     # ---------- internal helpers ----------
 
@@ -149,22 +234,76 @@ class JsonEventStore:
         '''
         Load the data from the file.
 
+        The parsed content is cached and reused for as long as revision()
+        reports the file unchanged, so repeated operations do not re-read
+        and re-parse it. Callers get their own copy of the event list and
+        may mutate it before passing it to _save_data.
+
         Returns:
             list[dict[str, Any]]: The data from the file.
         '''
+        cache = self._cached()
+        return {**cache, "events": list(cache["events"])}
+
+    def _cached(self) -> dict[str, list[dict[str, Any]]]:
+        '''
+        Return the cached file content, re-reading it if the file changed.
+
+        The result is shared with the cache and must not be mutated.
+
+        Returns:
+            dict[str, list[dict[str, Any]]]: The data from the file.
+        '''
         self._ensure_file()
+        rev = self.revision()
+        data = self._cache
+        if data is None or rev != self._cache_rev:
+            data = self._read_file()
+            # files written by older versions or by hand may be unsorted;
+            # an already sorted list costs one linear pass
+            data["events"].sort(key=_sort_key)
+            self._set_cache(data, rev)
+        return data
+
+    def _set_cache(
+        self, data: dict[str, list[dict[str, Any]]], rev: tuple[int, int, int] | None
+    ) -> None:
+        '''
+        Remember parsed file content and index its events by id.
+
+        Args:
+            data: The data from the file.
+            rev: The revision() token of the file holding that data.
+        '''
+        index: dict[str, int] = {}
+        for i, e in enumerate(data["events"]):
+            event_id = e.get("id")
+            if event_id is not None:
+                index.setdefault(event_id, i)  # first occurrence wins, like a scan
+        self._cache = data
+        self._cache_rev = rev
+        self._id_index = index
+        self._events = None
+
+    def _read_file(self) -> dict[str, list[dict[str, Any]]]:
+        '''
+        Read and parse the data file.
+
+        Returns:
+            list[dict[str, Any]]: The data from the file.
+        '''
         try:
-            raw = self.path.read_text(encoding="utf-8")
+            raw = self.path.read_bytes()
             if not raw:
                 return {"events": []}
 
-            data = json.loads(raw)
+            data = _json_loads(raw)
             if isinstance(data, list):
                 return {"events": data}
             if isinstance(data, dict) and "events" in data:
                 return data
             raise StorageError(f"Invalid data format: {data}") from None
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson's error subclasses this one
             raise StorageError(f"Failed to parse JSON: {e}") from None
         except OSError as e:
             raise StorageError(f"Failed to read file: {e}") from None
@@ -177,12 +316,18 @@ class JsonEventStore:
             data: The data to save.
         '''
         self._ensure_file()
+        # nearly sorted after a single add/update, so this is cheap
+        data["events"].sort(key=_sort_key)
         tmp = self.path.with_suffix(self.path.suffix + ".tmp")
         try:
-            content = json.dumps(data, indent=2)
-            tmp.write_text(content, encoding="utf-8")
+            with open(tmp, "wb") as f:
+                f.write(_json_dumps(data))
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
             tmp.replace(self.path)
         except OSError as e:
+            self._cache = None
             raise StorageError(f"Failed to write file: {e}") from None
         finally:
             try:
@@ -190,6 +335,8 @@ class JsonEventStore:
                     tmp.unlink()
             except OSError as e:
                 raise StorageError(f"Failed to delete temporary file: {e}")
+        # what was just written is the current content
+        self._set_cache(data, self.revision())
 
     def _event_to_dict(self, event: Event) -> dict[str, Any]:
         '''
@@ -221,13 +368,15 @@ class JsonEventStore:
             return Event(
                 id=str(data["id"]),
                 title=str(data["title"]),
-                description=data["description"],
-                date=date.fromisoformat(data["date"]),
+                description=_optional_str(data["description"]),
+                date=_parse_date(data["date"]),
                 start_time=str(data["start_time"]),
                 duration_min=int(data["duration_min"]),
-                location=data.get("location"),
-                create_at=datetime.fromisoformat(data["create_at"]),
-                update_at=datetime.fromisoformat(data["update_at"]),
+                location=_optional_str(data.get("location")),
+                create_at=_parse_datetime(data["create_at"]),
+                update_at=_parse_datetime(data["update_at"]),
             )
         except KeyError as e:
             raise StorageError(f"Missing required field: {e}") from None
+        except ValueError as e:
+            raise StorageError(f"Invalid field value: {e}") from None
@@ -0,0 +1,34 @@
+"""
+Pytest configuration and fixtures shared by all test suites
+
+This file is automatically loaded by pytest and provides fixtures
+to the unit, integration and e2e tests.
+"""
+
+import sys
+
+import pytest
+
+from calctl.cli import main
+
+
+@pytest.fixture
+def run_cli(monkeypatch, capsys):
+    """
+    Run calctl.cli.main() in-process and capture its output
+
+    Returns:
+        Callable: run(*args) -> (stdout, stderr, exit code); args exclude
+        the program name, and the exit code is 0 when main() returns or
+        exits with SystemExit(None)
+    """
+    def run(*args):
+        monkeypatch.setattr(sys, 'argv', ['calctl', *args])
+        try:
+            main()
+            code = 0
+        except SystemExit as e:
+            code = e.code if e.code is not None else 0
+        captured = capsys.readouterr()
+        return captured.out, captured.err, code
+    return run
@@ -19,6 +19,7 @@ Guidelines:
 import pytest
 import subprocess
 import tempfile
+import shutil
 from pathlib import Path
 
 
@@ -47,7 +48,6 @@ def isolated_env(monkeypatch):
     yield data_path
     
     # Cleanup
-    import shutil
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
@@ -58,7 +58,6 @@ def isolated_calctl_env(monkeypatch):
     yield data_file
     
     # Cleanup
-    import shutil
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
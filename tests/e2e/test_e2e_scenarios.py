@@ -7,6 +7,7 @@ They are slower but provide confidence that the system works as a whole.
 
 import pytest
 import json
+import re
 import subprocess
 from pathlib import Path
 
@@ -272,7 +273,6 @@ class TestDeleteOperations:
         add_result = run_calctl('add', '--title', 'To Delete',
                                '--date', '2026-02-10', '--time', '10:00',
                                '--duration', '30')
-        import re
         event_id = re.search(r'evt-[a-f0-9]+', add_result.stdout).group(0)
         
         # Delete with confirmation (send 'y' to stdin)
@@ -286,7 +286,6 @@ class TestDeleteOperations:
         add_result = run_calctl('add', '--title', 'Test',
                                '--date', '2026-02-10', '--time', '10:00',
                                '--duration', '30')
-        import re
         event_id = re.search(r'evt-[a-f0-9]+', add_result.stdout).group(0)
         
         # Dry run
@@ -327,7 +326,6 @@ class TestEditOperations:
         add_result = run_calctl('add', '--title', 'Original',
                                '--date', '2026-02-10', '--time', '10:00',
                                '--duration', '30')
-        import re
         event_id = re.search(r'evt-[a-f0-9]+', add_result.stdout).group(0)
         
         # Edit event
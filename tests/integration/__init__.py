@@ -12,6 +12,7 @@ Guidelines:
 """
 
 import pytest
+import json
 import tempfile
 from pathlib import Path
 from datetime import date, datetime
@@ -119,8 +120,6 @@ def verify_file_contains_event(file_path: Path, event_id: str) -> bool:
     Returns:
         bool: True if event found in file
     """
-    import json
-    
     with open(file_path, 'r') as f:
         data = json.load(f)
     
@@ -7,6 +7,7 @@ to all integration tests.
 """
 
 import pytest
+import json
 import tempfile
 from pathlib import Path
 from datetime import date, datetime
@@ -117,8 +118,6 @@ def verify_file_contains_event(file_path: Path, event_id: str) -> bool:
     Returns:
         bool: True if event found in file
     """
-    import json
-    
     with open(file_path, 'r') as f:
         data = json.load(f)
     
@@ -15,6 +15,7 @@ from datetime import date, datetime, timedelta
 
 from calctl.store import JsonEventStore
 from calctl.service import CalendarService
+from calctl.conflict import overlaps
 from calctl.errors import InvalidInputError, NotFoundError, ConflictError, StorageError
 
 
@@ -158,7 +159,6 @@ class TestEdgeCaseScenarios:
         first_event = events[0]
         conflicts = [e for e in events if e.id != first_event.id]
         
-        from calctl.conflict import overlaps
         for conflict in conflicts:
             assert overlaps(first_event, conflict)
     
@@ -139,6 +139,33 @@ class TestConflictDetection:
         # Both events should exist
         all_events = svc.list_events()
         assert len(all_events) == 2
+    
+    @pytest.mark.parametrize("duration,conflicts", [(70000, True), (-30, False)])
+    def test_out_of_range_stored_event_does_not_crash(self, temp_data_path, duration, conflicts):
+        """Test that a hand-edited duration outside one day is still conflict-checked"""
+        CalendarService(JsonEventStore(temp_data_path)).add_event("Stored", "2026-12-01", "09:00", 30)
+        data = json.loads(temp_data_path.read_text())
+        data["events"][0]["duration_min"] = duration
+        temp_data_path.write_text(json.dumps(data))
+        
+        svc = CalendarService(JsonEventStore(temp_data_path))
+        if conflicts:
+            with pytest.raises(ConflictError):
+                svc.add_event("New", "2026-12-01", "15:00", 30)
+        else:
+            assert len(svc.add_event("New", "2026-12-01", "15:00", 30)) == 1
+    
+    def test_non_string_stored_text_fields_are_listed(self, temp_data_path):
+        """Test that a hand-edited number in description/location is read as text"""
+        CalendarService(JsonEventStore(temp_data_path)).add_event("Stored", "2026-12-01", "09:00", 30)
+        data = json.loads(temp_data_path.read_text())
+        data["events"][0]["description"] = 5
+        data["events"][0]["location"] = 12
+        temp_data_path.write_text(json.dumps(data))
+        
+        events = CalendarService(JsonEventStore(temp_data_path)).list_events()
+        
+        assert [(e.description, e.location) for e in events] == [("5", "12")]
 
 
 class TestRecurringEvents:
@@ -16,6 +16,9 @@ from unittest.mock import Mock
 from datetime import date, datetime
 
 
+# fixed timestamp shared by the helpers below, so nothing reads the clock
+_FIXED_NOW = datetime(2026, 2, 10, 12, 0, 0)
+
 # ============================================================================
 # Shared Fixtures for Unit Tests
 # ============================================================================
@@ -29,7 +32,7 @@ def mock_store():
 @pytest.fixture
 def mock_datetime():
     """Create a fixed datetime for testing"""
-    return datetime(2026, 2, 10, 12, 0, 0)
+    return _FIXED_NOW
 
 
 # ============================================================================
@@ -56,8 +59,8 @@ def make_mock_event(event_id: str, title: str, event_date: date):
     mock_event.duration_min = 60
     mock_event.description = None
     mock_event.location = None
-    mock_event.create_at = datetime.now()
-    mock_event.update_at = datetime.now()
+    mock_event.create_at = _FIXED_NOW
+    mock_event.update_at = _FIXED_NOW
     return mock_event
 
 
@@ -70,8 +73,6 @@ def assert_error_raised(func, error_class, message_contains=None):
         error_class: Expected error class
         message_contains: Optional substring to check in error message
     """
-    import pytest
-    
     if message_contains:
         with pytest.raises(error_class, match=message_contains):
             func()
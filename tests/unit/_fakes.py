@@ -0,0 +1,76 @@
+"""
+Lightweight stand-ins for the store and service used by the CLI tests
+
+The CLI only passes the store to the service and calls service methods,
+so these replace the Mock objects with plain classes that record just
+what the tests look at. Like create_autospec, the service's stubs check
+each call against the real CalendarService method signature.
+"""
+
+import inspect
+from unittest.mock import call
+
+from calctl.service import CalendarService
+
+
+class Stub:
+    """
+    A callable that records its calls, like the small part of Mock the tests use
+
+    Set return_value, or side_effect to an exception to raise it; calls are
+    kept in call_args_list as unittest.mock.call objects. With a signature,
+    calls that would not bind to it raise TypeError.
+    """
+
+    def __init__(self, signature=None):
+        self.signature = signature
+        self.return_value = None
+        self.side_effect = None
+        self.call_args_list = []
+
+    @property
+    def called(self):
+        return bool(self.call_args_list)
+
+    def __call__(self, *args, **kwargs):
+        if self.signature is not None:
+            self.signature.bind(*args, **kwargs)
+        self.call_args_list.append(call(*args, **kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+class NullStore:
+    """A store that holds nothing; only ever handed to the (fake) service"""
+
+    def list_all(self):
+        return []
+
+
+class FakeService:
+    """A CalendarService whose methods are Stubs with the real signatures"""
+
+    METHODS = (
+        'add_event', 'list_events', 'show_event', 'show_event_with_conflicts',
+        'delete_event', 'edit_event', 'search_events', 'parse_date',
+        'agenda_day', 'agenda_week', 'get_events_on_date', 'delete_on_date',
+        'parse_date_public',
+    )
+
+    def __init__(self):
+        for name, sig in _SIGNATURES.items():
+            setattr(self, name, Stub(sig))
+
+
+def _bound_signature(func):
+    """Signature of a method as called on an instance (without self)"""
+    sig = inspect.signature(func)
+    return sig.replace(parameters=list(sig.parameters.values())[1:])
+
+
+# built once; getattr also fails here if a name is not a service method
+_SIGNATURES = {
+    name: _bound_signature(getattr(CalendarService, name))
+    for name in FakeService.METHODS
+}
@@ -0,0 +1,69 @@
+"""
+Pytest configuration and shared fixtures for unit tests
+
+This file is automatically loaded by pytest and provides fixtures
+to all unit tests.
+"""
+
+from datetime import date
+
+import pytest
+
+from calctl.models import Event
+from tests.unit import _FIXED_NOW
+from tests.unit._fakes import FakeService, NullStore
+
+
+# ============================================================================
+# Models
+# ============================================================================
+
+@pytest.fixture
+def event_factory():
+    """
+    Build real Events from defaults plus keyword overrides
+
+    Returns:
+        Callable: make(**overrides) -> Event; a 30 min event on 2026-02-10
+        at 10:00 unless overridden
+    """
+    def make(**overrides):
+        fields = dict(
+            id="evt", title="T", description=None,
+            date=date(2026, 2, 10), start_time="10:00", duration_min=30,
+            location=None, create_at=_FIXED_NOW, update_at=_FIXED_NOW,
+        )
+        fields.update(overrides)
+        return Event(**fields)
+    return make
+
+
+# ============================================================================
+# CLI Fakes
+# ============================================================================
+
+@pytest.fixture
+def mock_store(monkeypatch):
+    """
+    Make calctl.cli.main() build a NullStore instead of a JsonEventStore
+
+    Returns:
+        NullStore: The store main() will receive
+    """
+    store = NullStore()
+    monkeypatch.setattr('calctl.store.JsonEventStore', lambda *a, **k: store)
+    return store
+
+
+@pytest.fixture
+def mock_service(monkeypatch):
+    """
+    Make calctl.cli.main() build a FakeService instead of a CalendarService
+
+    Returns:
+        FakeService: The service main() will call; configure its Stubs
+    """
+    svc = FakeService()
+    monkeypatch.setattr('calctl.service.CalendarService', lambda *a, **k: svc)
+    return svc
+
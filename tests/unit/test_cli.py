@@ -5,209 +5,168 @@ Tests the CLI argument parsing and command dispatch logic.
 """
 
 import pytest
-import sys
-from unittest.mock import Mock, patch, MagicMock
-from io import StringIO
-from datetime import date
-from calctl.cli import build_parser, main, default_data_path
+from unittest.mock import call
+from types import SimpleNamespace
+from datetime import date, datetime, timedelta
+from calctl.cli import build_parser, default_data_path, requested_command, SUBCOMMANDS
 from calctl.errors import InvalidInputError, NotFoundError, ConflictError
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Build the argument parser once; parse_args does not modify it"""
+    return build_parser()
+
+
+@pytest.mark.parser
 class TestBuildParser:
     """Test argument parser construction"""
     
-    def test_parser_has_version(self):
+    def test_parser_has_version(self, parser):
         """Test that parser has version argument"""
-        parser = build_parser()
-        
         # Try parsing --version
         with pytest.raises(SystemExit) as exc_info:
             parser.parse_args(['--version'])
         
         assert exc_info.value.code == 0
     
-    def test_parser_has_no_color_flag(self):
-        """Test that parser has --no-color flag"""
-        parser = build_parser()
-        args = parser.parse_args(['--no-color', 'list'])
-        
-        assert args.no_color is True
-    
-    def test_parser_has_json_flag(self):
-        """Test that parser has TestMainAgendaCommand flag"""
-        parser = build_parser()
-        args = parser.parse_args(['--json', 'list'])
-        
-        assert args.json is True
+    @pytest.mark.parametrize("argv,expected", [
+        (['--no-color', 'list'], {'no_color': True}),
+        (['--json', 'list'], {'json': True}),
+    ], ids=['no-color', 'json'])
+    def test_parser_global_flags(self, parser, argv, expected):
+        """Test the global output flags"""
+        args = parser.parse_args(argv)
+        
+        for name, value in expected.items():
+            assert getattr(args, name) == value
+    
+    def test_build_parser_is_cached(self):
+        """Test that build_parser() returns the same parser every time"""
+        assert build_parser() is build_parser()
+        assert build_parser('add') is build_parser('add')
+    
+    def test_only_requested_subparser_built(self, monkeypatch):
+        """Test that a command's parser sets up only that command's arguments"""
+        called = []
+        for name, (help_text, setup) in SUBCOMMANDS.items():
+            def record(subp, name=name, setup=setup):
+                called.append(name)
+                setup(subp)
+            monkeypatch.setitem(SUBCOMMANDS, name, (help_text, record))
+        build_parser.cache_clear()
+        try:
+            args = build_parser('add').parse_args(_ADD)
+        finally:
+            build_parser.cache_clear()
+        
+        assert called == ['add']
+        assert args.title == 'Meeting'
     
-    def test_parser_json_and_plain_mutually_exclusive(self):
+    @pytest.mark.parametrize("argv,expected", [
+        (['add', '--title', 'list'], 'add'),
+        (['--json', '--no-color', 'show', 'evt-1234'], 'show'),
+        (['--version'], None),
+        (['unknown'], None),
+        ([], None),
+    ], ids=['first-positional', 'after-flags', 'no-command', 'unknown', 'empty'])
+    def test_requested_command(self, argv, expected):
+        """Test that the command is the first non-option argument"""
+        assert requested_command(argv) == expected
+    
+    def test_parser_json_and_plain_mutually_exclusive(self, parser):
         """Test that --json and --plain are mutually exclusive"""
-        parser = build_parser()
-        
         with pytest.raises(SystemExit):
             parser.parse_args(['--json', '--plain', 'list'])
 
 
+# argv prefix shared by the add cases
+_ADD = ['add', '--title', 'Meeting', '--date', '2026-02-10', '--time', '14:00', '--duration', '60']
+
+
+@pytest.mark.parser
 class TestParserAddCommand:
     """Test 'add' command argument parsing"""
     
-    def test_add_command_required_args(self):
-        """Test that add command requires title, date, time, duration"""
-        parser = build_parser()
-        
-        args = parser.parse_args([
-            'add',
-            '--title', 'Meeting',
-            '--date', '2026-02-10',
-            '--time', '14:00',
-            '--duration', '60'
-        ])
-        
-        assert args.cmd == 'add'
-        assert args.title == 'Meeting'
-        assert args.date == '2026-02-10'
-        assert args.time == '14:00'
-        assert args.duration == 60
-    
-    def test_add_command_optional_args(self):
-        """Test add command with optional arguments"""
-        parser = build_parser()
-        
-        args = parser.parse_args([
-            'add',
-            '--title', 'Meeting',
-            '--date', '2026-02-10',
-            '--time', '14:00',
-            '--duration', '60',
-            '--description', 'Team sync',
-            '--location', 'Room 101'
-        ])
-        
-        assert args.description == 'Team sync'
-        assert args.location == 'Room 101'
-    
-    def test_add_command_with_force(self):
-        """Test add command with --force flag"""
-        parser = build_parser()
-        
-        args = parser.parse_args([
-            'add',
-            '--title', 'Meeting',
-            '--date', '2026-02-10',
-            '--time', '14:00',
-            '--duration', '60',
-            '--force'
-        ])
+    @pytest.mark.parametrize("argv,expected", [
+        (_ADD, {'cmd': 'add', 'title': 'Meeting', 'date': '2026-02-10', 'time': '14:00', 'duration': 60}),
+        (_ADD + ['--description', 'Team sync', '--location', 'Room 101'],
+         {'description': 'Team sync', 'location': 'Room 101'}),
+        (_ADD + ['--force'], {'force': True}),
+        (['add', '--title', 'Standup', '--date', '2026-02-10', '--time', '09:00',
+          '--duration', '15', '--repeat', 'daily', '--count', '5'],
+         {'repeat': 'daily', 'count': 5}),
+    ], ids=['required', 'optional', 'force', 'repeat'])
+    def test_add_command(self, parser, argv, expected):
+        """Test add command arguments"""
+        args = parser.parse_args(argv)
+        
+        for name, value in expected.items():
+            assert getattr(args, name) == value
+    
+    def test_add_command_many_flags(self, parser):
+        """Test that a long run of repeated optional flags still parses"""
+        args = parser.parse_args(_ADD + ['--force'] * 200 + ['--count', '3'])
         
         assert args.force is True
-    
-    def test_add_command_with_repeat(self):
-        """Test add command with --repeat"""
-        parser = build_parser()
-        
-        args = parser.parse_args([
-            'add',
-            '--title', 'Standup',
-            '--date', '2026-02-10',
-            '--time', '09:00',
-            '--duration', '15',
-            '--repeat', 'daily',
-            '--count', '5'
-        ])
-        
-        assert args.repeat == 'daily'
-        assert args.count == 5
+        assert args.count == 3
 
 
+@pytest.mark.parser
 class TestParserListCommand:
     """Test 'list' command argument parsing"""
     
-    def test_list_command_no_args(self):
-        """Test list command with no arguments"""
-        parser = build_parser()
-        args = parser.parse_args(['list'])
-        
-        assert args.cmd == 'list'
-    
-    def test_list_command_today(self):
-        """Test list command with --today"""
-        parser = build_parser()
-        args = parser.parse_args(['list', '--today'])
-        
-        assert args.today is True
-    
-    def test_list_command_week(self):
-        """Test list command with --week"""
-        parser = build_parser()
-        args = parser.parse_args(['list', '--week'])
-        
-        assert args.week is True
-    
-    def test_list_command_date_range(self):
-        """Test list command with date range"""
-        parser = build_parser()
-        args = parser.parse_args([
-            'list',
-            '--from', '2026-02-01',
-            '--to', '2026-02-28'
-        ])
+    @pytest.mark.parametrize("argv,expected", [
+        (['list'], {'cmd': 'list'}),
+        (['list', '--today'], {'today': True}),
+        (['list', '--week'], {'week': True}),
+        (['list', '--from', '2026-02-01', '--to', '2026-02-28'],
+         {'from_date': '2026-02-01', 'to_date': '2026-02-28'}),
+    ], ids=['no-args', 'today', 'week', 'date-range'])
+    def test_list_command(self, parser, argv, expected):
+        """Test list command arguments"""
+        args = parser.parse_args(argv)
         
-        assert args.from_date == '2026-02-01'
-        assert args.to_date == '2026-02-28'
+        for name, value in expected.items():
+            assert getattr(args, name) == value
 
 
+@pytest.mark.parser
 class TestParserShowCommand:
     """Test 'show' command argument parsing"""
     
-    def test_show_command(self):
+    def test_show_command(self, parser):
         """Test show command with event ID"""
-        parser = build_parser()
         args = parser.parse_args(['show', 'evt-1234'])
         
         assert args.cmd == 'show'
         assert args.id == 'evt-1234'
 
 
+@pytest.mark.parser
 class TestParserDeleteCommand:
     """Test 'delete' command argument parsing"""
     
-    def test_delete_command_by_id(self):
-        """Test delete command with event ID"""
-        parser = build_parser()
-        args = parser.parse_args(['delete', 'evt-1234'])
-        
-        assert args.cmd == 'delete'
-        assert args.id == 'evt-1234'
-    
-    def test_delete_command_by_date(self):
-        """Test delete command by date"""
-        parser = build_parser()
-        args = parser.parse_args(['delete', '--date', '2026-02-10'])
-        
-        assert args.cmd == 'delete'
-        assert args.date == '2026-02-10'
-    
-    def test_delete_command_with_force(self):
-        """Test delete command with --force"""
-        parser = build_parser()
-        args = parser.parse_args(['delete', 'evt-1234', '--force'])
-        
-        assert args.force is True
-    
-    def test_delete_command_with_dry_run(self):
-        """Test delete command with --dry-run"""
-        parser = build_parser()
-        args = parser.parse_args(['delete', 'evt-1234', '--dry-run'])
+    @pytest.mark.parametrize("argv,expected", [
+        (['delete', 'evt-1234'], {'cmd': 'delete', 'id': 'evt-1234'}),
+        (['delete', '--date', '2026-02-10'], {'cmd': 'delete', 'date': '2026-02-10'}),
+        (['delete', 'evt-1234', '--force'], {'force': True}),
+        (['delete', 'evt-1234', '--dry-run'], {'dry_run': True}),
+    ], ids=['by-id', 'by-date', 'force', 'dry-run'])
+    def test_delete_command(self, parser, argv, expected):
+        """Test delete command arguments"""
+        args = parser.parse_args(argv)
         
-        assert args.dry_run is True
+        for name, value in expected.items():
+            assert getattr(args, name) == value
 
 
+@pytest.mark.parser
 class TestParserEditCommand:
     """Test 'edit' command argument parsing"""
     
-    def test_edit_command(self):
+    def test_edit_command(self, parser):
         """Test edit command with ID"""
-        parser = build_parser()
         args = parser.parse_args([
             'edit', 'evt-1234',
             '--title', 'Updated'
@@ -218,696 +177,284 @@ class TestParserEditCommand:
         assert args.title == 'Updated'
 
 
+@pytest.mark.parser
 class TestParserSearchCommand:
     """Test 'search' command argument parsing"""
     
-    def test_search_command(self):
-        """Test search command"""
-        parser = build_parser()
-        args = parser.parse_args(['search', 'meeting'])
+    @pytest.mark.parametrize("argv,expected", [
+        (['search', 'meeting'], {'cmd': 'search', 'query': 'meeting'}),
+        (['search', 'meeting', '--title'], {'title': True}),
+    ], ids=['query', 'title-only'])
+    def test_search_command(self, parser, argv, expected):
+        """Test search command arguments"""
+        args = parser.parse_args(argv)
         
-        assert args.cmd == 'search'
-        assert args.query == 'meeting'
-    
-    def test_search_command_title_only(self):
-        """Test search command with --title"""
-        parser = build_parser()
-        args = parser.parse_args(['search', 'meeting', '--title'])
-        
-        assert args.title is True
+        for name, value in expected.items():
+            assert getattr(args, name) == value
 
 
+@pytest.mark.parser
 class TestParserAgendaCommand:
     """Test 'agenda' command argument parsing"""
     
-    def test_agenda_command_default(self):
-        """Test agenda command with no arguments"""
-        parser = build_parser()
-        args = parser.parse_args(['agenda'])
-        
-        assert args.cmd == 'agenda'
-    
-    def test_agenda_command_week(self):
-        """Test agenda command with --week"""
-        parser = build_parser()
-        args = parser.parse_args(['agenda', '--week'])
+    @pytest.mark.parametrize("argv,expected", [
+        (['agenda'], {'cmd': 'agenda'}),
+        (['agenda', '--week'], {'week': True}),
+        (['agenda', '--date', '2026-02-10'], {'date': '2026-02-10'}),
+    ], ids=['default', 'week', 'date'])
+    def test_agenda_command(self, parser, argv, expected):
+        """Test agenda command arguments"""
+        args = parser.parse_args(argv)
         
-        assert args.week is True
-    
-    def test_agenda_command_date(self):
-        """Test agenda command with specific date"""
-        parser = build_parser()
-        args = parser.parse_args(['agenda', '--date', '2026-02-10'])
-        
-        assert args.date == '2026-02-10'
+        for name, value in expected.items():
+            assert getattr(args, name) == value
 
 
 class TestDefaultDataPath:
     """Test default_data_path function"""
     
-    def test_default_data_path_format(self):
+    def test_default_data_path_format(self, tmp_path, monkeypatch):
         """Test that default path has correct format"""
+        # a private home, so parallel workers never share ~/.calctl
+        monkeypatch.setenv('HOME', str(tmp_path))
+        monkeypatch.setenv('USERPROFILE', str(tmp_path))
         path = default_data_path()
         
         assert str(path).endswith('.calctl/events.json')
-        assert 'events.json' in str(path)
+        assert path == tmp_path / '.calctl' / 'events.json'
+
+
+# attributes of the events built by fake_event
+_FAKE_DEFAULTS = dict(
+    id='evt-1234',
+    title='Test',
+    description=None,
+    date=date(2026, 2, 10),
+    start_time='10:00',
+    duration_min=60,
+    location=None,
+    create_at=datetime(2026, 2, 1, 10, 0, 0),
+    update_at=datetime(2026, 2, 1, 10, 0, 0),
+)
 
 
+def fake_event(**fields):
+    """
+    Build a plain stand-in for an Event with the attributes the CLI prints
+    
+    Cheaper than a configured Mock; keyword arguments override the defaults
+    and end_dt() follows from date, start_time and duration_min.
+    """
+    e = SimpleNamespace(**{**_FAKE_DEFAULTS, **fields})
+    start = datetime.strptime(e.start_time, '%H:%M').time()
+    e.end_dt = lambda: datetime.combine(e.date, start) + timedelta(minutes=e.duration_min)
+    return e
+
+
+@pytest.fixture(scope="session")
+def sample_event():
+    """One fake event shared by the read-only show/delete tests; never modify it"""
+    return fake_event(description='Description', location='Office')
+
+
+@pytest.mark.cli
+@pytest.mark.usefixtures("mock_store")
 class TestMainAddCommand:
     """Test main() with 'add' command"""
     
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_add_command_success(self, mock_store_cls, mock_service_cls):
+    # command lines used by the tests below
+    ADD_ARGS = ('add', '--title', 'Test', '--date', '2026-02-10', '--time', '10:00', '--duration', '60')
+    
+    def test_main_add_command_success(self, run_cli, mock_service):
         """Test main() successfully adds event"""
-        # Setup mocks
-        mock_store = Mock()
-        mock_store_cls.return_value = mock_store
-        
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
         # Mock add_event to return a list with one event
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_service.add_event.return_value = [mock_event]
-        
-        # Mock sys.argv
-        test_args = [
-            'calctl', 'add',
-            '--title', 'Test',
-            '--date', '2026-02-10',
-            '--time', '10:00',
-            '--duration', '60'
-        ]
+        mock_service.add_event.return_value = [fake_event()]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                try:
-                    main()
-                except SystemExit:
-                    pass
+        _, _, code = run_cli(*self.ADD_ARGS)
+        
+        assert code == 0
         
         # Verify service was called
-        mock_service.add_event.assert_called_once()
+        assert mock_service.add_event.call_args_list == [
+            call('Test', '2026-02-10', '10:00', 60, None, None, force=False, repeat=None, count=1)
+        ]
 
 
+@pytest.mark.cli
+@pytest.mark.usefixtures("mock_store")
 class TestMainErrorHandling:
     """Test main() error handling"""
     
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_handles_invalid_input_error(self, mock_store_cls, mock_service_cls):
+    # command lines used by the tests below
+    EMPTY_TITLE_ARGS = ('add', '--title', '', '--date', '2026-02-10', '--time', '10:00', '--duration', '60')
+    
+    def test_main_handles_invalid_input_error(self, run_cli, mock_service):
         """Test that main() handles InvalidInputError"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
         # Make add_event raise InvalidInputError
         mock_service.add_event.side_effect = InvalidInputError("Invalid input")
         
-        test_args = [
-            'calctl', 'add',
-            '--title', '',
-            '--date', '2026-02-10',
-            '--time', '10:00',
-            '--duration', '60'
-        ]
+        _, _, code = run_cli(*self.EMPTY_TITLE_ARGS)
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stderr', new=StringIO()):
-                with pytest.raises(SystemExit) as exc_info:
-                    main()
-                
-                # Should exit with code 2 (InvalidInputError)
-                assert exc_info.value.code == 2
+        # Should exit with code 2 (InvalidInputError)
+        assert code == 2
     
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_handles_not_found_error(self, mock_store_cls, mock_service_cls):
+    def test_main_handles_not_found_error(self, run_cli, mock_service):
         """Test that main() handles NotFoundError"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
         # 修复：应该 mock show_event_with_conflicts
         mock_service.show_event_with_conflicts.side_effect = NotFoundError("Not found")
         
-        test_args = ['calctl', 'show', 'evt-9999']
+        _, _, code = run_cli('show', 'evt-9999')
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stderr', new=StringIO()):
-                with pytest.raises(SystemExit) as exc_info:
-                    main()
-                
-                # Should exit with code 3 (NotFoundError)
-                assert exc_info.value.code == 3
+        # Should exit with code 3 (NotFoundError)
+        assert code == 3
     
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_handles_keyboard_interrupt(self, mock_store_cls, mock_service_cls):
+    def test_main_handles_keyboard_interrupt(self, run_cli, mock_service):
         """Test that main() handles KeyboardInterrupt"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
         mock_service.list_events.side_effect = KeyboardInterrupt()
         
-        test_args = ['calctl', 'list']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stderr', new=StringIO()):
-                with pytest.raises(SystemExit) as exc_info:
-                    main()
-                
-                # Should exit with code 130 (KeyboardInterrupt)
-                assert exc_info.value.code == 130
-
-
-class TestMainListCommand:
-    """Test main() with 'list' command execution"""
-    
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_list_command_json_output(self, mock_store_cls, mock_service_cls):
-        """Test list command with JSON output"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        # Mock event
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Test'
-        mock_event.date.isoformat.return_value = '2026-02-10'
-        mock_event.start_time = '10:00'
-        mock_event.duration_min = 60
-        mock_event.description = None
-        mock_event.location = None
-        mock_event.create_at.isoformat.return_value = '2026-02-01T10:00:00'
-        mock_event.update_at.isoformat.return_value = '2026-02-01T10:00:00'
-        
-        mock_service.list_events.return_value = [mock_event]
-        
-        test_args = ['calctl', '--json', 'list']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-                
-                output = fake_out.getvalue()
-                assert 'evt-1234' in output or output != ''
-
-    
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_list_command_plain_output(self, mock_store_cls, mock_service_cls):
-        """Test list command with plain text output"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        # Mock event
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Test Event'
-        mock_event.date.isoformat.return_value = '2026-02-10'
-        mock_event.start_time = '10:00'
-        mock_event.duration_min = 60
-        
-        mock_service.list_events.return_value = [mock_event]
-        
-        test_args = ['calctl', 'list']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-                
-                output = fake_out.getvalue()
-                assert 'evt-1234' in output or 'Test Event' in output
-    
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_list_command_empty(self, mock_store_cls, mock_service_cls):
-        """Test list command with no events"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        mock_service.list_events.return_value = []
-        
-        test_args = ['calctl', 'list']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-                
-                output = fake_out.getvalue()
-                # Should show "No events found" or similar
-                assert len(output) >= 0  # At least some output
-
-
-class TestMainShowCommand:
-    """Test main() with 'show' command execution"""
-    
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_show_command_json(self, mock_store_cls, mock_service_cls):
-        """Test show command with JSON output"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        # Mock event
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Test'
-        mock_event.description = 'Description'
-        mock_event.date.isoformat.return_value = '2026-02-10'
-        mock_event.start_time = '10:00'
-        mock_event.end_dt.return_value.strftime.return_value = '11:00'
-        mock_event.duration_min = 60
-        mock_event.location = 'Office'
-        mock_event.create_at.isoformat.return_value = '2026-02-01T10:00:00'
-        mock_event.update_at.isoformat.return_value = '2026-02-01T10:00:00'
-        
-        mock_service.show_event_with_conflicts.return_value = (mock_event, [])
-        
-        test_args = ['calctl', '--json', 'show', 'evt-1234']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-                
-                output = fake_out.getvalue()
-                assert 'evt-1234' in output or output != ''
-    
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_show_command_plain(self, mock_store_cls, mock_service_cls):
-        """Test show command with plain output"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        # Mock event
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Test'
-        mock_event.description = 'Description'
-        mock_event.date.isoformat.return_value = '2026-02-10'
-        mock_event.start_time = '10:00'
-        mock_event.end_dt.return_value.strftime.return_value = '11:00'
-        mock_event.duration_min = 60
-        mock_event.location = 'Office'
-        mock_event.create_at.isoformat.return_value = '2026-02-01T10:00:00'
-        mock_event.update_at.isoformat.return_value = '2026-02-01T10:00:00'
-        
-        mock_service.show_event_with_conflicts.return_value = (mock_event, [])
-        
-        test_args = ['calctl', 'show', 'evt-1234']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-                
-                output = fake_out.getvalue()
-                assert 'ID:' in output or 'evt-1234' in output
-
-
-class TestMainSearchCommand:
-    """Test main() with 'search' command"""
-    
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_search_command(self, mock_store_cls, mock_service_cls):
-        """Test search command"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Meeting'
-        mock_event.date.isoformat.return_value = '2026-02-10'
-        mock_event.start_time = '10:00'
-        mock_event.duration_min = 60
-        
-        mock_service.search_events.return_value = [mock_event]
-        
-        test_args = ['calctl', 'search', 'meeting']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-                
-                output = fake_out.getvalue()
-                assert len(output) > 0
-
-
+        _, _, code = run_cli('list')
+        
+        # Should exit with code 130 (KeyboardInterrupt)
+        assert code == 130
+
+
+# (argv, service method -> return value, text expected on stdout) for
+# commands that succeed; every configured method must have been called
+_WEEK = {date(2026, 2, 8) + timedelta(days=i): [] for i in range(7)}
+_SCENARIOS = [
+    (['--json', 'list'], {'list_events': [fake_event()]}, '"id": "evt-1234"'),
+    (['list'], {'list_events': [fake_event(title='Test Event')]}, 'Test Event'),
+    (['list'], {'list_events': []}, 'No events found.'),
+    (['list', '--from', '2026-02-01'], {'parse_date': date(2026, 2, 1), 'list_events': []}, 'No events found.'),
+    (['list', '--to', '2026-02-28'], {'parse_date': date(2026, 2, 28), 'list_events': []}, 'No events found.'),
+    (['--json', 'show', 'evt-1234'], {'show_event_with_conflicts': (fake_event(), [])}, '"id": "evt-1234"'),
+    (['show', 'evt-1234'], {'show_event_with_conflicts': (fake_event(), [])}, 'ID: evt-1234'),
+    (['search', 'meeting'], {'search_events': [fake_event(title='Meeting')]}, 'Meeting'),
+    (['edit', 'evt-1234', '--title', 'Updated'],
+     {'edit_event': (fake_event(title='Updated'), {'title': ('Old', 'Updated')})}, 'Updated: evt-1234'),
+    (['agenda', '--date', '2026-02-10'],
+     {'parse_date_public': date(2026, 2, 10), 'agenda_day': []}, '2026-02-10 - Agenda'),
+    (['agenda', '--week'], {'agenda_week': _WEEK}, 'Week Agenda (2026-02-08 ~ 2026-02-14)'),
+]
+
+
+@pytest.mark.cli
+@pytest.mark.usefixtures("mock_store")
+class TestMainScenarios:
+    """Test main() on the read and edit commands that succeed"""
+    
+    @pytest.mark.parametrize("argv,returns,expected", _SCENARIOS, ids=[
+        'list-json', 'list-plain', 'list-empty', 'list-from', 'list-to',
+        'show-json', 'show-plain', 'search', 'edit', 'agenda-day', 'agenda-week',
+    ])
+    def test_main_scenario(self, run_cli, mock_service, argv, returns, expected):
+        """Test that the command exits cleanly and prints the expected text"""
+        for name, value in returns.items():
+            getattr(mock_service, name).return_value = value
+        
+        out, err, code = run_cli(*argv)
+        
+        assert code == 0
+        assert err == ''
+        assert expected in out
+        for name in returns:
+            assert getattr(mock_service, name).called, name
+
+
+@pytest.mark.cli
+@pytest.mark.usefixtures("mock_store")
 class TestMainDeleteCommand:
     """Test main() with 'delete' command"""
     
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_delete_by_id_with_force(self, mock_store_cls, mock_service_cls):
+    def test_main_delete_by_id_with_force(self, run_cli, mock_service, sample_event):
         """Test delete by ID with --force"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Test'
-        mock_event.date.isoformat.return_value = '2026-02-10'
-        mock_event.start_time = '10:00'
-        mock_event.end_dt.return_value.strftime.return_value = '11:00'
-        
-        mock_service.show_event.return_value = mock_event
-        mock_service.delete_event.return_value = mock_event
+        mock_service.show_event.return_value = sample_event
+        mock_service.delete_event.return_value = sample_event
         
-        test_args = ['calctl', 'delete', 'evt-1234', '--force']
+        _, _, code = run_cli('delete', 'evt-1234', '--force')
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()):
-                try:
-                    main()
-                except SystemExit:
-                    pass
+        assert code == 0
         
-        mock_service.delete_event.assert_called_once_with('evt-1234')
+        assert mock_service.delete_event.call_args_list == [call('evt-1234')]
     
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_delete_by_id_dry_run(self, mock_store_cls, mock_service_cls):
+    def test_main_delete_by_id_dry_run(self, run_cli, mock_service, sample_event):
         """Test delete with --dry-run"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Test'
-        mock_event.date.isoformat.return_value = '2026-02-10'
-        mock_event.start_time = '10:00'
-        mock_event.end_dt.return_value.strftime.return_value = '11:00'
-        
-        mock_service.show_event.return_value = mock_event
-        
-        test_args = ['calctl', 'delete', 'evt-1234', '--dry-run']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()):
-                with pytest.raises(SystemExit) as exc_info:
-                    main()
-                
-                assert exc_info.value.code == 0
-    
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_delete_by_date(self, mock_store_cls, mock_service_cls):
-        """Test delete by date"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
+        mock_service.show_event.return_value = sample_event
         
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Test'
-        mock_event.start_time = '10:00'
-        mock_event.end_dt.return_value.strftime.return_value = '11:00'
-        
-        mock_service.get_events_on_date.return_value = [mock_event]
-        mock_service.delete_on_date.return_value = 1
+        _, _, code = run_cli('delete', 'evt-1234', '--dry-run')
         
-        test_args = ['calctl', 'delete', '--date', '2026-02-10', '--force']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()):
-                try:
-                    main()
-                except SystemExit:
-                    pass
-
-
-class TestMainEditCommand:
-    """Test main() with 'edit' command"""
+        assert code == 0
     
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_edit_command(self, mock_store_cls, mock_service_cls):
-        """Test edit command"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Updated'
-        
-        changes = {'title': ('Old', 'Updated')}
-        mock_service.edit_event.return_value = (mock_event, changes)
-        
-        test_args = ['calctl', 'edit', 'evt-1234', '--title', 'Updated']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()):
-                try:
-                    main()
-                except SystemExit:
-                    pass
-        
-        mock_service.edit_event.assert_called_once()
-
-
-class TestMainAgendaCommand:
-    """Test main() with 'agenda' command"""
-    
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_agenda_day(self, mock_store_cls, mock_service_cls):
-        """Test agenda for a day"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        # 修复：使用 datetime.date
-        from datetime import date  # 确保导入
-        mock_service.parse_date_public.return_value = date(2026, 2, 10)
-        mock_service.agenda_day.return_value = []
-        
-        test_args = ['calctl', 'agenda', '--date', '2026-02-10']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()):
-                try:
-                    main()
-                except SystemExit:
-                    pass
-    
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_agenda_week(self, mock_store_cls, mock_service_cls):
-        """Test agenda for a week"""
-        from datetime import date, timedelta
-        
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        # 修复：提供有效的week字典（7天数据）
-        today = date.today()
-        week = {}
-        for i in range(7):
-            d = today + timedelta(days=i)
-            week[d] = []  # 每天空事件列表
-        
-        mock_service.agenda_week.return_value = week  # ← 修改这里
-        
-        test_args = ['calctl', 'agenda', '--week']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()):
-                try:
-                    main()
-                except SystemExit:
-                    pass
-
-
-class TestMainListCommandVariations:
-    """Test list command with different filter combinations"""
-    
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_list_with_from_date_only(self, mock_store_cls, mock_service_cls):
-        """Test list with only --from date"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        mock_service.parse_date.return_value = date(2026, 2, 1)
-        mock_service.list_events.return_value = []
-        
-        test_args = ['calctl', 'list', '--from', '2026-02-01']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()):
-                try:
-                    main()
-                except SystemExit:
-                    pass
-    
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_list_with_to_date_only(self, mock_store_cls, mock_service_cls):
-        """Test list with only --to date"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        mock_service.parse_date.return_value = date(2026, 2, 28)
-        mock_service.list_events.return_value = []
+    def test_main_delete_by_date(self, run_cli, mock_service, sample_event):
+        """Test delete by date"""
+        mock_service.get_events_on_date.return_value = [sample_event]
+        mock_service.delete_on_date.return_value = 1
         
-        test_args = ['calctl', 'list', '--to', '2026-02-28']
+        _, _, code = run_cli('delete', '--date', '2026-02-10', '--force')
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()):
-                try:
-                    main()
-                except SystemExit:
-                    pass
+        assert code == 0
 
 
+@pytest.mark.cli
+@pytest.mark.usefixtures("mock_store")
 class TestMainShowCommandWithConflicts:
     """Test show command when conflicts exist"""
     
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    def test_main_show_with_conflicts(self, mock_store_cls, mock_service_cls):
+    def test_main_show_with_conflicts(self, run_cli, mock_service, sample_event):
         """Test show command displaying conflicts"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        # Mock main event
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Test'
-        mock_event.description = 'Description'
-        mock_event.date.isoformat.return_value = '2026-02-10'
-        mock_event.start_time = '10:00'
-        mock_event.end_dt.return_value.strftime.return_value = '11:00'
-        mock_event.duration_min = 60
-        mock_event.location = 'Office'
-        mock_event.create_at.isoformat.return_value = '2026-02-01T10:00:00'
-        mock_event.update_at.isoformat.return_value = '2026-02-01T10:00:00'
-        
         # Mock conflicting event
-        conflict = Mock()
-        conflict.id = 'evt-5678'
-        conflict.title = 'Conflicting'
-        conflict.start_time = '10:30'
-        conflict.end_dt.return_value.strftime.return_value = '11:30'
+        conflict = fake_event(id='evt-5678', title='Conflicting', start_time='10:30')
+        
+        mock_service.show_event_with_conflicts.return_value = (sample_event, [conflict])
         
-        mock_service.show_event_with_conflicts.return_value = (mock_event, [conflict])
+        out, _, code = run_cli('show', 'evt-1234')
         
-        test_args = ['calctl', 'show', 'evt-1234']
+        assert code == 0
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                try:
-                    main()
-                except SystemExit:
-                    pass
-                
-                output = fake_out.getvalue()
-                # Should show conflict information
-                assert 'Conflict' in output or len(output) > 0
+        # Should show conflict information
+        assert 'Conflict' in out or len(out) > 0
 
 
+@pytest.mark.cli
+@pytest.mark.usefixtures("mock_store")
 class TestMainDeleteWithConfirmation:
     """Test delete command with user confirmation"""
     
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    @patch('builtins.input', return_value='y')  # Mock user input
-    def test_main_delete_with_yes_confirmation(self, mock_input, mock_store_cls, mock_service_cls):
+    # command lines used by the tests below
+    DELETE_ARGS = ('delete', 'evt-1234')
+    
+    def test_main_delete_with_yes_confirmation(self, run_cli, mock_service, monkeypatch, sample_event):
         """Test delete with user confirming 'yes'"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Test'
-        mock_event.date.isoformat.return_value = '2026-02-10'
-        mock_event.start_time = '10:00'
-        mock_event.end_dt.return_value.strftime.return_value = '11:00'
+        monkeypatch.setattr('builtins.input', lambda *_: 'y')
+        mock_service.show_event.return_value = sample_event
+        mock_service.delete_event.return_value = sample_event
         
-        mock_service.show_event.return_value = mock_event
-        mock_service.delete_event.return_value = mock_event
+        _, _, code = run_cli(*self.DELETE_ARGS)
         
-        test_args = ['calctl', 'delete', 'evt-1234']
+        assert code == 0
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()):
-                try:
-                    main()
-                except SystemExit:
-                    pass
-        
-        mock_service.delete_event.assert_called_once()
+        assert mock_service.delete_event.call_args_list == [call('evt-1234')]
     
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    @patch('builtins.input', return_value='n')  # Mock user input
-    def test_main_delete_with_no_confirmation(self, mock_input, mock_store_cls, mock_service_cls):
+    def test_main_delete_with_no_confirmation(self, run_cli, mock_service, monkeypatch, sample_event):
         """Test delete with user declining"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Test'
-        mock_event.date.isoformat.return_value = '2026-02-10'
-        mock_event.start_time = '10:00'
-        mock_event.end_dt.return_value.strftime.return_value = '11:00'
+        monkeypatch.setattr('builtins.input', lambda *_: 'n')
+        mock_service.show_event.return_value = sample_event
         
-        mock_service.show_event.return_value = mock_event
+        _, _, code = run_cli(*self.DELETE_ARGS)
         
-        test_args = ['calctl', 'delete', 'evt-1234']
-        
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stderr', new=StringIO()):
-                with pytest.raises(SystemExit) as exc_info:
-                    main()
-                
-                assert exc_info.value.code == 1
+        assert code == 1
         
         # Should NOT call delete_event
-        mock_service.delete_event.assert_not_called()
+        assert mock_service.delete_event.call_args_list == []
     
-    @patch('calctl.cli.CalendarService')
-    @patch('calctl.cli.JsonEventStore')
-    @patch('builtins.input', return_value='y')
-    def test_main_delete_by_date_with_confirmation(self, mock_input, mock_store_cls, mock_service_cls):
+    def test_main_delete_by_date_with_confirmation(self, run_cli, mock_service, monkeypatch, sample_event):
         """Test delete by date with confirmation"""
-        mock_service = Mock()
-        mock_service_cls.return_value = mock_service
-        
-        mock_event = Mock()
-        mock_event.id = 'evt-1234'
-        mock_event.title = 'Test'
-        mock_event.start_time = '10:00'
-        mock_event.end_dt.return_value.strftime.return_value = '11:00'
-        
-        mock_service.get_events_on_date.return_value = [mock_event]
+        monkeypatch.setattr('builtins.input', lambda *_: 'y')
+        mock_service.get_events_on_date.return_value = [sample_event]
         mock_service.delete_on_date.return_value = 1
         
-        test_args = ['calctl', 'delete', '--date', '2026-02-10']
+        _, _, code = run_cli('delete', '--date', '2026-02-10')
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('sys.stdout', new=StringIO()):
-                try:
-                    main()
-                except SystemExit:
-                    pass
+        assert code == 0
         
-        mock_service.delete_on_date.assert_called_once()
\ No newline at end of file
+        assert mock_service.delete_on_date.call_args_list == [call('2026-02-10')]
\ No newline at end of file
@@ -6,7 +6,6 @@ Tests ANSI color output functionality.
 
 import pytest
 import sys
-from io import StringIO
 from calctl.color import Color
 
 
@@ -169,4 +168,14 @@ class TestTTYDetection:
         result = c.green("Test")
         # In non-TTY, should be plain
         if not sys.stdout.isatty():
-            assert result == "Test"
\ No newline at end of file
+            assert result == "Test"
+    
+    def test_toggling_enabled_rebinds_methods(self):
+        """Test that switching enabled off again returns plain text"""
+        c = Color(enabled=False, stream="stdout")
+        c.enabled = True
+        assert c.green("Ok") == "\033[32mOk\033[0m"
+        
+        c.enabled = False
+        assert c.green("Ok") == "Ok"
+        assert c.bold("Ok") == "Ok"
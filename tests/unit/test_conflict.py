@@ -7,7 +7,11 @@ Tests the event overlap detection algorithm.
 import pytest
 from datetime import date, datetime
 from calctl.models import Event
-from calctl.conflict import overlaps
+from calctl.conflict import IntervalIndex, overlaps
+
+
+# fixed timestamp: tests never depend on the wall clock
+_NOW = datetime(2026, 1, 1, 0, 0, 0)
 
 
 def make_event(event_id: str, date_val: date, start: str, duration: int) -> Event:
@@ -20,8 +24,8 @@ def make_event(event_id: str, date_val: date, start: str, duration: int) -> Even
         start_time=start,
         duration_min=duration,
         location=None,
-        create_at=datetime.now(),
-        update_at=datetime.now()
+        create_at=_NOW,
+        update_at=_NOW
     )
 
 
@@ -221,4 +225,78 @@ class TestIntervalLogic:
         
         # But if e2 starts at 09:59, they SHOULD overlap
         e3 = make_event("evt-0003", d, "09:59", 60)
-        assert overlaps(e1, e3)
\ No newline at end of file
+        assert overlaps(e1, e3)
+
+
+class TestIntervalIndex:
+    """Test the per-date IntervalIndex used for batch conflict checks"""
+    
+    def test_finds_overlapping_events(self):
+        """Only events overlapping [start, end) on the same date are returned"""
+        d = date(2026, 2, 10)
+        e1 = make_event("evt-0001", d, "09:00", 60)   # 9:00-10:00
+        e2 = make_event("evt-0002", d, "10:30", 60)   # 10:30-11:30
+        e3 = make_event("evt-0003", d, "13:00", 60)   # 13:00-14:00
+        index = IntervalIndex([e3, e1, e2])
+        
+        new = make_event("evt-0004", d, "09:30", 90)  # 9:30-11:00
+        
+        assert index.overlapping(new) == [e1, e2]
+    
+    def test_adjacent_events_not_returned(self):
+        """Touching intervals do not overlap"""
+        d = date(2026, 2, 10)
+        index = IntervalIndex([make_event("evt-0001", d, "09:00", 60)])
+        
+        assert index.overlapping(make_event("evt-0002", d, "10:00", 60)) == []
+    
+    def test_other_dates_ignored(self):
+        """Events on other dates never overlap"""
+        index = IntervalIndex([make_event("evt-0001", date(2026, 2, 10), "10:00", 60)])
+        
+        assert index.overlapping(make_event("evt-0002", date(2026, 2, 11), "10:00", 60)) == []
+    
+    def test_same_id_ignored(self):
+        """An event never conflicts with itself"""
+        d = date(2026, 2, 10)
+        e1 = make_event("evt-0001", d, "10:00", 60)
+        index = IntervalIndex([e1])
+        
+        assert index.overlapping(e1) == []
+    
+    def test_matches_overlaps(self):
+        """Index results agree with pairwise overlaps()"""
+        d = date(2026, 2, 10)
+        existing = [
+            make_event(f"evt-{i:04d}", d, f"{8 + i % 10:02d}:{(i * 7) % 60:02d}", 15 + i * 5)
+            for i in range(20)
+        ]
+        index = IntervalIndex(existing)
+        new = make_event("evt-9999", d, "11:15", 45)
+        
+        expected = {e.id for e in existing if overlaps(new, e)}
+        
+        assert {e.id for e in index.overlapping(new)} == expected
+    
+    def test_long_early_event_still_found(self):
+        """An early event that outlasts later short ones is not skipped"""
+        d = date(2026, 2, 10)
+        long_event = make_event("evt-0001", d, "08:00", 240)  # 8:00-12:00
+        short = make_event("evt-0002", d, "09:00", 30)         # 9:00-9:30
+        later = make_event("evt-0003", d, "10:00", 15)         # 10:00-10:15
+        index = IntervalIndex([short, later, long_event])
+        
+        new = make_event("evt-0004", d, "11:00", 30)           # 11:00-11:30
+        
+        assert index.overlapping(new) == [long_event]
+    
+    def test_out_of_range_minutes_accepted(self):
+        """Events read from a corrupt store may end past midnight or before they start"""
+        d = date(2026, 2, 10)
+        huge = make_event("evt-0001", d, "09:00", 70000)
+        negative = make_event("evt-0002", d, "12:00", -30)
+        index = IntervalIndex([huge, negative])
+        
+        new = make_event("evt-0003", d, "15:00", 30)
+        
+        assert index.overlapping(new) == [e for e in (huge, negative) if overlaps(new, e)]
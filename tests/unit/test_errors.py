@@ -17,41 +17,30 @@ from calctl.errors import (
 class TestErrorHierarchy:
     """Test exception inheritance"""
     
-    def test_all_errors_inherit_from_calctl_error(self):
-        """Test that all custom errors inherit from CalctlError"""
-        assert issubclass(InvalidInputError, CalctlError)
-        assert issubclass(NotFoundError, CalctlError)
-        assert issubclass(StorageError, CalctlError)
-        assert issubclass(ConflictError, CalctlError)
-    
-    def test_all_errors_inherit_from_exception(self):
-        """Test that CalctlError inherits from Exception"""
-        assert issubclass(CalctlError, Exception)
-        assert issubclass(InvalidInputError, Exception)
+    @pytest.mark.parametrize("cls", [InvalidInputError, NotFoundError, StorageError, ConflictError])
+    def test_inherits_calctl_error(self, cls):
+        """Test that every custom error inherits from CalctlError"""
+        assert issubclass(cls, CalctlError)
+    
+    @pytest.mark.parametrize("cls", [CalctlError, InvalidInputError, NotFoundError, StorageError, ConflictError])
+    def test_inherits_exception(self, cls):
+        """Test that every calctl error is an Exception"""
+        assert issubclass(cls, Exception)
 
 
 class TestErrorExitCodes:
     """Test exit codes for each error type"""
     
-    def test_calctl_error_exit_code(self):
-        """Test CalctlError has exit code 1"""
-        assert CalctlError.exit_code == 1
-    
-    def test_invalid_input_error_exit_code(self):
-        """Test InvalidInputError has exit code 2"""
-        assert InvalidInputError.exit_code == 2
-    
-    def test_not_found_error_exit_code(self):
-        """Test NotFoundError has exit code 3"""
-        assert NotFoundError.exit_code == 3
-    
-    def test_storage_error_exit_code(self):
-        """Test StorageError has exit code 1"""
-        assert StorageError.exit_code == 1
-    
-    def test_conflict_error_exit_code(self):
-        """Test ConflictError has exit code 4"""
-        assert ConflictError.exit_code == 4
+    @pytest.mark.parametrize("cls,code", [
+        (CalctlError, 1),
+        (InvalidInputError, 2),
+        (NotFoundError, 3),
+        (StorageError, 1),
+        (ConflictError, 4),
+    ])
+    def test_exit_code(self, cls, code):
+        """Test each error type has its documented exit code"""
+        assert cls.exit_code == code
     
     def test_exit_codes_are_distinct(self):
         """Test that different error types have distinct exit codes (where appropriate)"""
@@ -67,37 +56,19 @@ class TestErrorExitCodes:
 class TestErrorRaising:
     """Test that errors can be raised and caught"""
     
-    def test_raise_invalid_input_error(self):
-        """Test raising InvalidInputError"""
-        with pytest.raises(InvalidInputError) as exc_info:
-            raise InvalidInputError("Invalid input")
-        
-        assert str(exc_info.value) == "Invalid input"
-        assert exc_info.value.exit_code == 2
-    
-    def test_raise_not_found_error(self):
-        """Test raising NotFoundError"""
-        with pytest.raises(NotFoundError) as exc_info:
-            raise NotFoundError("Event not found")
+    @pytest.mark.parametrize("cls,msg,code", [
+        (InvalidInputError, "Invalid input", 2),
+        (NotFoundError, "Event not found", 3),
+        (StorageError, "Failed to read file", 1),
+        (ConflictError, "Event conflicts", 4),
+    ])
+    def test_raise_error(self, cls, msg, code):
+        """Test raising each error type keeps its message and exit code"""
+        with pytest.raises(cls) as exc_info:
+            raise cls(msg)
         
-        assert "not found" in str(exc_info.value).lower()
-        assert exc_info.value.exit_code == 3
-    
-    def test_raise_storage_error(self):
-        """Test raising StorageError"""
-        with pytest.raises(StorageError) as exc_info:
-            raise StorageError("Failed to read file")
-        
-        assert "failed" in str(exc_info.value).lower()
-        assert exc_info.value.exit_code == 1
-    
-    def test_raise_conflict_error(self):
-        """Test raising ConflictError"""
-        with pytest.raises(ConflictError) as exc_info:
-            raise ConflictError("Event conflicts")
-        
-        assert "conflict" in str(exc_info.value).lower()
-        assert exc_info.value.exit_code == 4
+        assert str(exc_info.value) == msg
+        assert exc_info.value.exit_code == code
     
     def test_catch_as_calctl_error(self):
         """Test that specific errors can be caught as CalctlError"""
@@ -135,4 +106,24 @@ class TestErrorMessages:
         """Test error message with special characters"""
         msg = "Error: 'title' field is required (got: \"\")"
         err = InvalidInputError(msg)
-        assert str(err) == msg
\ No newline at end of file
+        assert str(err) == msg
+    
+    def test_short_message_is_interned(self):
+        """Test that equal short messages share one string object"""
+        a = NotFoundError("".join(["Event evt-1234", " not found"]))
+        b = NotFoundError("".join(["Event evt-1234", " not found"]))
+        assert a.args[0] is b.args[0]
+    
+    def test_non_string_args_are_kept(self):
+        """Test that non-string and multiple arguments pass through unchanged"""
+        err = StorageError(2, "No such file")
+        assert err.args == (2, "No such file")
+    
+    def test_str_subclass_message_is_kept(self):
+        """Test that a str subclass message is passed through, not interned"""
+        class Message(str):
+            pass
+        
+        err = InvalidInputError(Message("bad input"))
+        assert str(err) == "bad input"
+        assert type(err.args[0]) is Message
@@ -8,13 +8,15 @@ import pytest
 from datetime import date, datetime, timedelta
 from calctl.models import Event
 
+# fixed timestamp for create_at/update_at; no test depends on its value
+_NOW = datetime(2026, 1, 1, 12, 0, 0)
+
 
 class TestEventCreation:
     """Test Event object creation and immutability"""
     
     def test_event_creation_with_all_fields(self):
         """Test creating an Event with all fields"""
-        now = datetime.now()
         e = Event(
             id="evt-1234",
             title="Team Meeting",
@@ -23,8 +25,8 @@ class TestEventCreation:
             start_time="09:00",
             duration_min=30,
             location="Conference Room A",
-            create_at=now,
-            update_at=now
+            create_at=_NOW,
+            update_at=_NOW
         )
         
         assert e.id == "evt-1234"
@@ -34,12 +36,11 @@ class TestEventCreation:
         assert e.start_time == "09:00"
         assert e.duration_min == 30
         assert e.location == "Conference Room A"
-        assert e.create_at == now
-        assert e.update_at == now
+        assert e.create_at == _NOW
+        assert e.update_at == _NOW
     
     def test_event_creation_with_optional_none(self):
         """Test creating an Event with None optional fields"""
-        now = datetime.now()
         e = Event(
             id="evt-5678",
             title="Quick Task",
@@ -48,8 +49,8 @@ class TestEventCreation:
             start_time="14:30",
             duration_min=15,
             location=None,
-            create_at=now,
-            update_at=now
+            create_at=_NOW,
+            update_at=_NOW
         )
         
         assert e.description is None
@@ -57,7 +58,6 @@ class TestEventCreation:
     
     def test_event_is_immutable(self):
         """Test that Event is frozen and cannot be modified"""
-        now = datetime.now()
         e = Event(
             id="evt-0000",
             title="Test",
@@ -66,8 +66,8 @@ class TestEventCreation:
             start_time="10:00",
             duration_min=60,
             location=None,
-            create_at=now,
-            update_at=now
+            create_at=_NOW,
+            update_at=_NOW
         )
         
         # Attempting to modify should raise FrozenInstanceError
@@ -81,196 +81,44 @@ class TestEventCreation:
 class TestEventStartDt:
     """Test Event.start_dt() method"""
     
-    def test_start_dt_morning(self):
-        """Test start_dt calculation for morning time"""
-        e = Event(
-            id="evt-0001",
-            title="Morning Meeting",
-            description=None,
-            date=date(2026, 2, 10),
-            start_time="09:30",
-            duration_min=60,
-            location=None,
-            create_at=datetime.now(),
-            update_at=datetime.now()
-        )
-        
-        dt = e.start_dt()
-        assert dt.date() == date(2026, 2, 10)
-        assert dt.hour == 9
-        assert dt.minute == 30
-        assert dt.second == 0
-    
-    def test_start_dt_afternoon(self):
-        """Test start_dt calculation for afternoon time"""
-        e = Event(
-            id="evt-0002",
-            title="Afternoon Meeting",
-            description=None,
-            date=date(2026, 3, 15),
-            start_time="14:45",
-            duration_min=30,
-            location=None,
-            create_at=datetime.now(),
-            update_at=datetime.now()
-        )
-        
-        dt = e.start_dt()
-        assert dt.date() == date(2026, 3, 15)
-        assert dt.hour == 14
-        assert dt.minute == 45
-    
-    def test_start_dt_midnight(self):
-        """Test start_dt calculation for midnight"""
-        e = Event(
-            id="evt-0003",
-            title="Midnight Task",
-            description=None,
-            date=date(2026, 2, 10),
-            start_time="00:00",
-            duration_min=30,
-            location=None,
-            create_at=datetime.now(),
-            update_at=datetime.now()
-        )
-        
-        dt = e.start_dt()
-        assert dt.hour == 0
-        assert dt.minute == 0
-    
-    def test_start_dt_end_of_day(self):
-        """Test start_dt calculation for late evening"""
-        e = Event(
-            id="evt-0004",
-            title="Late Meeting",
-            description=None,
-            date=date(2026, 2, 10),
-            start_time="23:45",
-            duration_min=10,
-            location=None,
-            create_at=datetime.now(),
-            update_at=datetime.now()
-        )
-        
-        dt = e.start_dt()
-        assert dt.hour == 23
-        assert dt.minute == 45
+    @pytest.mark.parametrize("day,start,hour,minute", [
+        (date(2026, 2, 10), "09:30", 9, 30),   # morning
+        (date(2026, 3, 15), "14:45", 14, 45),  # afternoon
+        (date(2026, 2, 10), "00:00", 0, 0),    # midnight
+        (date(2026, 2, 10), "23:45", 23, 45),  # late evening
+    ])
+    def test_start_dt(self, event_factory, day, start, hour, minute):
+        """Test start_dt combines the date with the start time"""
+        dt = event_factory(date=day, start_time=start).start_dt()
+        
+        assert (dt.date(), dt.hour, dt.minute, dt.second) == (day, hour, minute, 0)
 
 
 class TestEventEndDt:
     """Test Event.end_dt() method"""
     
-    def test_end_dt_simple_case(self):
-        """Test end_dt calculation for simple duration"""
-        e = Event(
-            id="evt-0005",
-            title="30 min meeting",
-            description=None,
-            date=date(2026, 2, 10),
-            start_time="10:00",
-            duration_min=30,
-            location=None,
-            create_at=datetime.now(),
-            update_at=datetime.now()
-        )
-        
+    @pytest.mark.parametrize("start,duration,hour,minute,day", [
+        ("10:00", 30, 10, 30, date(2026, 2, 10)),    # simple case
+        ("14:45", 30, 15, 15, date(2026, 2, 10)),    # crosses hour boundary
+        ("09:00", 150, 11, 30, date(2026, 2, 10)),   # 2.5 hours
+        ("14:00", 90, 15, 30, date(2026, 2, 10)),
+        ("00:00", 1440, 0, 0, date(2026, 2, 11)),    # full day ends next day
+    ])
+    def test_end_dt(self, event_factory, start, duration, hour, minute, day):
+        """Test end_dt is start_dt plus the duration"""
+        e = event_factory(start_time=start, duration_min=duration)
         end = e.end_dt()
-        assert end.hour == 10
-        assert end.minute == 30
-    
-    def test_end_dt_crosses_hour_boundary(self):
-        """Test end_dt when duration crosses hour boundary"""
-        e = Event(
-            id="evt-0006",
-            title="Cross hour",
-            description=None,
-            date=date(2026, 2, 10),
-            start_time="14:45",
-            duration_min=30,
-            location=None,
-            create_at=datetime.now(),
-            update_at=datetime.now()
-        )
         
-        end = e.end_dt()
-        assert end.hour == 15
-        assert end.minute == 15
-    
-    def test_end_dt_multiple_hours(self):
-        """Test end_dt with multi-hour duration"""
-        e = Event(
-            id="evt-0007",
-            title="Long meeting",
-            description=None,
-            date=date(2026, 2, 10),
-            start_time="09:00",
-            duration_min=150,  # 2.5 hours
-            location=None,
-            create_at=datetime.now(),
-            update_at=datetime.now()
-        )
-        
-        end = e.end_dt()
-        assert end.hour == 11
-        assert end.minute == 30
-    
-    def test_end_dt_full_day(self):
-        """Test end_dt with maximum allowed duration"""
-        e = Event(
-            id="evt-0008",
-            title="All day",
-            description=None,
-            date=date(2026, 2, 10),
-            start_time="00:00",
-            duration_min=1440,  # 24 hours
-            location=None,
-            create_at=datetime.now(),
-            update_at=datetime.now()
-        )
-        
-        end = e.end_dt()
-        # Should be next day at 00:00
-        assert end.date() == date(2026, 2, 11)
-        assert end.hour == 0
-        assert end.minute == 0
-    
-    def test_end_dt_preserves_date_info(self):
-        """Test that end_dt preserves date information"""
-        e = Event(
-            id="evt-0009",
-            title="Test",
-            description=None,
-            date=date(2026, 2, 10),
-            start_time="14:00",
-            duration_min=90,
-            location=None,
-            create_at=datetime.now(),
-            update_at=datetime.now()
-        )
-        
-        start = e.start_dt()
-        end = e.end_dt()
-        
-        # Verify relationship
-        assert (end - start) == timedelta(minutes=90)
+        assert (end.date(), end.hour, end.minute) == (day, hour, minute)
+        assert end - e.start_dt() == timedelta(minutes=duration)
 
 
 class TestEventEdgeCases:
     """Test Event edge cases and boundary conditions"""
     
-    def test_zero_duration_event(self):
+    def test_zero_duration_event(self, event_factory):
         """Test event with zero duration (instant event)"""
-        e = Event(
-            id="evt-0010",
-            title="Instant",
-            description=None,
-            date=date(2026, 2, 10),
-            start_time="12:00",
-            duration_min=0,
-            location=None,
-            create_at=datetime.now(),
-            update_at=datetime.now()
-        )
+        e = event_factory(start_time="12:00", duration_min=0)
         
         assert e.start_dt() == e.end_dt()
     
@@ -284,8 +132,8 @@ class TestEventEdgeCases:
             start_time="10:00",
             duration_min=30,
             location="",
-            create_at=datetime.now(),
-            update_at=datetime.now()
+            create_at=_NOW,
+            update_at=_NOW
         )
         
         assert e.id == ""
@@ -305,8 +153,8 @@ class TestEventEdgeCases:
             start_time="10:00",
             duration_min=30,
             location=None,
-            create_at=now,
-            update_at=now
+            create_at=_NOW,
+            update_at=_NOW
         )
         
         e2 = Event(
@@ -317,8 +165,8 @@ class TestEventEdgeCases:
             start_time="10:00",
             duration_min=30,
             location=None,
-            create_at=now,
-            update_at=now
+            create_at=_NOW,
+            update_at=_NOW
         )
         
         assert e1 == e2
@@ -333,11 +181,48 @@ class TestEventEdgeCases:
             start_time="10:00",
             duration_min=30,
             location=None,
-            create_at=datetime.now(),
-            update_at=datetime.now()
+            create_at=_NOW,
+            update_at=_NOW
         )
         
         # Should be able to add to set
         event_set = {e}
         assert len(event_set) == 1
-        assert e in event_set
\ No newline at end of file
+        assert e in event_set
+
+
+class TestEventNormalization:
+    """Test text normalization done in Event.__post_init__"""
+    
+    def test_text_fields_are_stripped(self, event_factory):
+        """Test that title, description and location are stripped"""
+        e = event_factory(title="  Team Sync  ", description="  Notes  ", location="  Room 1  ")
+        
+        assert e.title == "Team Sync"
+        assert e.description == "Notes"
+        assert e.location == "Room 1"
+    
+    def test_search_text_is_cached(self, event_factory):
+        """Test that the lowercased search text is precomputed"""
+        e = event_factory(id="evt-0012", title="Team SYNC", location="Room A")
+        
+        assert e._ci_title == "team sync"
+        assert e._ci_text == "evt-0012 team sync  room a 2026-02-10 10:00 30"
+    
+    def test_date_ordinal_is_cached(self, event_factory):
+        """Test that the date ordinal is precomputed for comparisons"""
+        e = event_factory(date=date(2027, 1, 1))
+        
+        assert e._ord == date(2027, 1, 1).toordinal()
+        assert e.date == date(2027, 1, 1)
+    
+    def test_minute_interval_is_cached(self, event_factory):
+        """Test that start/end minutes are precomputed for overlap checks"""
+        e = event_factory(start_time="14:45")
+        
+        assert e._start_min == 14 * 60 + 45
+        assert e._end_min == 15 * 60 + 15
+    
+    def test_event_has_no_instance_dict(self, event_factory):
+        """Test that Event is slotted (no per-instance __dict__)"""
+        assert not hasattr(event_factory(), "__dict__")
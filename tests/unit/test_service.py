@@ -6,12 +6,17 @@ Tests the CalendarService business logic with mocked dependencies.
 
 import pytest
 from unittest.mock import Mock, MagicMock
+from dataclasses import replace
 from datetime import date, datetime, timedelta
 from calctl.service import CalendarService
 from calctl.models import Event
 from calctl.errors import InvalidInputError, NotFoundError, ConflictError
 
 
+# fixed timestamp: tests never depend on the wall clock
+_NOW = datetime(2026, 1, 1, 0, 0, 0)
+
+
 def make_event(event_id: str, title: str, date_val: date, start: str = "10:00", duration: int = 60) -> Event:
     """Helper to create test events"""
     return Event(
@@ -22,8 +27,8 @@ def make_event(event_id: str, title: str, date_val: date, start: str = "10:00",
         start_time=start,
         duration_min=duration,
         location=None,
-        create_at=datetime.now(),
-        update_at=datetime.now()
+        create_at=_NOW,
+        update_at=_NOW
     )
 
 
@@ -170,6 +175,26 @@ class TestAddEventConflictDetection:
         events = service.add_event("New", "2026-02-11", "14:00", 60)
         
         assert len(events) == 1
+    
+    def test_add_recurring_conflict_reports_occurrence_and_skips_write(self, service, mock_store):
+        """Test that a clash on one occurrence aborts the whole series"""
+        existing = make_event("evt-0001", "Busy", date(2026, 2, 12), "09:00", 60)
+        mock_store.list_all.return_value = [existing]
+        
+        with pytest.raises(ConflictError, match="on 2026-02-12"):
+            service.add_event("Standup", "2026-02-10", "09:30", 15, repeat="daily", count=5)
+        mock_store.add_many.assert_not_called()
+    
+    def test_add_recurring_checks_up_to_last_occurrence(self, service, mock_store):
+        """Test that stored events around the series' date range are sliced correctly"""
+        mock_store.list_all.return_value = [
+            make_event("evt-0001", "Before", date(2026, 2, 9), "09:00", 60),
+            make_event("evt-0002", "Last", date(2026, 3, 3), "09:00", 60),
+            make_event("evt-0003", "After", date(2026, 3, 10), "09:00", 60),
+        ]
+        
+        with pytest.raises(ConflictError, match="on 2026-03-03"):
+            service.add_event("Weekly", "2026-02-10", "09:30", 15, repeat="weekly", count=4)
 
 
 class TestAddEventRecurring:
@@ -214,6 +239,16 @@ class TestAddEventRecurring:
         """Test that invalid count raises error"""
         with pytest.raises(InvalidInputError, match="must be a positive integer"):
             service.add_event("Test", "2026-02-10", "10:00", 30, repeat="daily", count=0)
+    
+    def test_add_recurring_reads_store_once(self, service, mock_store):
+        """Test that conflict checks for all occurrences share one store read"""
+        mock_store.list_all.return_value = [make_event("evt-0001", "Existing", date(2026, 3, 1))]
+        
+        events = service.add_event("Standup", "2026-02-10", "09:00", 15, repeat="daily", count=5)
+        
+        assert len(events) == 5
+        assert mock_store.list_all.call_count == 1
+        mock_store.add_many.assert_called_once()
 
 
 class TestAddEventCrossesMidnight:
@@ -286,6 +321,27 @@ class TestShowEvent:
         
         with pytest.raises(NotFoundError, match="not found"):
             service.show_event("evt-9999")
+    
+    def test_show_event_with_conflicts(self, service, mock_store):
+        """Test that conflicts are found from a single store read"""
+        target = make_event("evt-0001", "Target", date(2026, 2, 10), start="10:00")
+        clash = make_event("evt-0002", "Clash", date(2026, 2, 10), start="10:30")
+        other = make_event("evt-0003", "Other", date(2026, 2, 10), start="12:00")
+        mock_store.list_all.return_value = [target, clash, other]
+        
+        e, conflicts = service.show_event_with_conflicts("evt-0001")
+        
+        assert e is target
+        assert conflicts == [clash]
+        mock_store.list_all.assert_called_once()
+        mock_store.get_by_id.assert_not_called()
+    
+    def test_show_event_with_conflicts_not_found(self, service, mock_store):
+        """Test that an unknown id raises NotFoundError"""
+        mock_store.list_all.return_value = []
+        
+        with pytest.raises(NotFoundError, match="not found"):
+            service.show_event_with_conflicts("evt-9999")
 
 
 class TestDeleteEvent:
@@ -331,6 +387,28 @@ class TestEditEvent:
         
         with pytest.raises(InvalidInputError, match="No fields provided"):
             service.edit_event("evt-0001")
+    
+    def test_edit_event_crossing_midnight_raises_error(self, service, mock_store):
+        """Test that extending an event past midnight is rejected"""
+        original = make_event("evt-0001", "Late", date(2026, 2, 10), start="23:00", duration=30)
+        mock_store.get_by_id.return_value = original
+        mock_store.list_all.return_value = [original]
+        
+        with pytest.raises(InvalidInputError, match="cannot cross midnight"):
+            service.edit_event("evt-0001", duration=60)
+        mock_store.update.assert_not_called()
+    
+    def test_edit_event_same_values_skips_write(self, service, mock_store):
+        """Test that an edit which changes nothing does not rewrite the store"""
+        original = make_event("evt-0001", "Test", date(2026, 2, 10))
+        mock_store.get_by_id.return_value = original
+        mock_store.list_all.return_value = [original]
+        
+        updated, changes = service.edit_event("evt-0001", title="Test", time_str="10:00")
+        
+        assert updated is original
+        assert changes == {}
+        mock_store.update.assert_not_called()
 
 
 class TestSearchEvents:
@@ -348,6 +426,44 @@ class TestSearchEvents:
         assert len(results) == 1
         assert "Meeting" in results[0].title
     
+    def test_search_events_title_only_ignores_other_fields(self, service, mock_store):
+        """Test that title-only search does not match descriptions"""
+        events = [
+            replace(make_event("evt-0001", "Lunch", date(2026, 2, 10)), description="meeting notes"),
+            make_event("evt-0002", "Team Meeting", date(2026, 2, 10), start="12:00"),
+        ]
+        mock_store.list_all.return_value = events
+        
+        assert [e.id for e in service.search_events("meeting")] == ["evt-0001", "evt-0002"]
+        assert [e.id for e in service.search_events("meeting", title_only=True)] == ["evt-0002"]
+    
+    def test_search_events_matches_date_and_time(self, service, mock_store):
+        """Test that numeric queries match the date and start time"""
+        events = [
+            make_event("evt-0001", "Standup", date(2026, 2, 10), start="09:15"),
+            make_event("evt-0002", "Review", date(2026, 2, 11), start="14:00"),
+        ]
+        mock_store.list_all.return_value = events
+        
+        assert [e.id for e in service.search_events("2026-02-11")] == ["evt-0002"]
+        assert [e.id for e in service.search_events("09:15")] == ["evt-0001"]
+    
+    def test_search_events_query_spans_fields(self, service, mock_store):
+        """Test that a query can run across fields, e.g. date followed by time"""
+        events = [
+            make_event("evt-0001", "Standup", date(2026, 2, 10), start="10:00"),
+            make_event("evt-0002", "Review", date(2026, 2, 10), start="14:00"),
+        ]
+        mock_store.list_all.return_value = events
+        
+        assert [e.id for e in service.search_events("2026-02-10 10:00")] == ["evt-0001"]
+    
+    def test_search_events_id_is_case_insensitive(self, service, mock_store):
+        """Test that ids match regardless of the query's case"""
+        mock_store.list_all.return_value = [make_event("evt-ab12", "Lunch", date(2026, 2, 10))]
+        
+        assert [e.id for e in service.search_events("EVT-AB12")] == ["evt-ab12"]
+    
     def test_search_empty_query_raises_error(self, service, mock_store):
         """Test that empty search query raises error"""
         with pytest.raises(InvalidInputError, match="cannot be empty"):
@@ -367,6 +483,15 @@ class TestHelperMethods:
         with pytest.raises(InvalidInputError):
             service._parse_date("invalid")
     
+    def test_parse_date_reuses_parsed_dates(self, service):
+        """Test that parsing the same string twice returns the same object"""
+        assert service._parse_date("2026-02-10") is service._parse_date(" 2026-02-10 ")
+    
+    def test_parse_date_out_of_range(self, service):
+        """Test that a well-formed but impossible date is rejected"""
+        with pytest.raises(InvalidInputError, match="Invalid date format"):
+            service._parse_date("2026-02-30")
+    
     def test_normalize_time_valid(self, service):
         """Test normalizing valid time"""
         assert service._normalize_time("9:00") == "09:00"
@@ -377,6 +502,11 @@ class TestHelperMethods:
         with pytest.raises(InvalidInputError):
             service._normalize_time("25:00")
     
+    def test_normalize_time_rejects_bad_minutes(self, service):
+        """Test that minutes outside 00-59 are rejected"""
+        with pytest.raises(InvalidInputError, match="Invalid time format"):
+            service._normalize_time("12:60")
+    
     def test_validate_duration_valid(self, service):
         """Test validating valid duration"""
         assert service._validate_duration(30) == 30
@@ -395,7 +525,6 @@ class TestListEventsAdvanced:
     
     def test_list_events_week_filter(self, service, mock_store):
         """Test weekly filtering"""
-        from datetime import date, timedelta
         today = date.today()
         
         events = [
@@ -407,6 +536,32 @@ class TestListEventsAdvanced:
         result = service.list_events(week=True)
         # Should only return events in current week
         assert len(result) >= 0
+    
+    def test_list_events_date_range(self, service, mock_store):
+        """Test from/to filtering over a date-sorted snapshot"""
+        events = [
+            make_event("evt-0001", "Before", date(2026, 2, 9)),
+            make_event("evt-0002", "First", date(2026, 2, 10)),
+            make_event("evt-0003", "Second", date(2026, 2, 10), start="12:00"),
+            make_event("evt-0004", "Last", date(2026, 2, 12)),
+            make_event("evt-0005", "After", date(2026, 2, 13)),
+        ]
+        mock_store.list_all.return_value = events
+        
+        result = service.list_events(from_date=date(2026, 2, 10), to_date=date(2026, 2, 12))
+        
+        assert [e.id for e in result] == ["evt-0002", "evt-0003", "evt-0004"]
+    
+    def test_list_events_open_ended_range(self, service, mock_store):
+        """Test that a missing bound leaves the range open on that side"""
+        events = [
+            make_event("evt-0001", "Old", date(2026, 1, 1)),
+            make_event("evt-0002", "New", date(2026, 3, 1)),
+        ]
+        mock_store.list_all.return_value = events
+        
+        assert [e.id for e in service.list_events(to_date=date(2026, 2, 1))] == ["evt-0001"]
+        assert [e.id for e in service.list_events(from_date=date(2026, 2, 1))] == ["evt-0002"]
 
 
 class TestAgendaMethods:
@@ -414,7 +569,6 @@ class TestAgendaMethods:
     
     def test_agenda_day(self, service, mock_store):
         """Test agenda_day method"""
-        from datetime import date
         d = date(2026, 2, 10)
         
         events = [
@@ -428,10 +582,27 @@ class TestAgendaMethods:
     
     def test_agenda_week(self, service, mock_store):
         """Test agenda_week method"""
-        from datetime import date
-        
         mock_store.list_all.return_value = []
         
         result = service.agenda_week()
         assert isinstance(result, dict)
-        assert len(result) == 7  # 7 days
\ No newline at end of file
+        assert len(result) == 7  # 7 days
+    
+    def test_agenda_week_buckets_events_by_day(self, service, mock_store):
+        """Test agenda_week groups the week's events per day with one store read"""
+        anchor = date(2026, 2, 11)  # Wednesday; week is Sun 02-08 .. Sat 02-14
+        events = [
+            make_event("evt-0001", "Before", date(2026, 2, 7)),
+            make_event("evt-0002", "Late", date(2026, 2, 11), start="15:00"),
+            make_event("evt-0003", "Early", date(2026, 2, 11), start="09:00"),
+            make_event("evt-0004", "Saturday", date(2026, 2, 14)),
+        ]
+        mock_store.list_all.return_value = events
+        
+        result = service.agenda_week(anchor)
+        
+        assert list(result) == [date(2026, 2, 8) + timedelta(days=i) for i in range(7)]
+        assert [e.id for e in result[date(2026, 2, 11)]] == ["evt-0003", "evt-0002"]
+        assert [e.id for e in result[date(2026, 2, 14)]] == ["evt-0004"]
+        assert sum(len(v) for v in result.values()) == 3
+        mock_store.list_all.assert_called_once()
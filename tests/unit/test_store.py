@@ -5,63 +5,98 @@ Tests the JsonEventStore with both mocked and real file operations.
 """
 
 import pytest
+import itertools
 import json
-import tempfile
-from pathlib import Path
+import re
+from dataclasses import replace
 from datetime import date, datetime
 from calctl.store import JsonEventStore
 from calctl.models import Event
 from calctl.errors import StorageError
 
 
+# error message patterns for pytest.raises(match=...)
+_ERR_EXISTS = re.compile("already exists")
+_ERR_DUP = re.compile("Duplicate event id")
+_ERR_NOT_FOUND = re.compile("not found")
+_ERR_PARSE = re.compile("Failed to parse JSON")
+_ERR_FORMAT = re.compile("Invalid data format")
+_ERR_MISSING = re.compile("Missing required field")
+
+# the dates the tests use
+_D10 = date(2026, 2, 10)
+_D11 = date(2026, 2, 11)
+_D12 = date(2026, 2, 12)
+
+# shared defaults for make_event; only id, title and date vary
+_TEMPLATE = Event(
+    id="",
+    title="",
+    description=None,
+    date=date(2026, 2, 1),
+    start_time="10:00",
+    duration_min=60,
+    location=None,
+    create_at=datetime(2026, 2, 1, 12, 0, 0),
+    update_at=datetime(2026, 2, 1, 12, 0, 0)
+)
+
+
 def make_event(event_id: str, title: str, date_val: date) -> Event:
     """Helper to create test events"""
-    return Event(
-        id=event_id,
-        title=title,
-        description=None,
-        date=date_val,
-        start_time="10:00",
-        duration_min=60,
-        location=None,
-        create_at=datetime(2026, 2, 1, 12, 0, 0),
-        update_at=datetime(2026, 2, 1, 12, 0, 0)
-    )
+    return replace(_TEMPLATE, id=event_id, title=title, date=date_val)
+
+
+# unique names below the shared root, so tests never need their own cleanup
+_counter = itertools.count()
+
+
+@pytest.fixture(scope="session")
+def _tmp_root(tmp_path_factory):
+    """Create one temporary root for the whole session (cleaned up by pytest)"""
+    return tmp_path_factory.mktemp("store")
 
 
 @pytest.fixture
-def temp_store():
+def temp_store(_tmp_root):
     """Create a temporary store for testing"""
-    temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-    temp_path = Path(temp_file.name)
-    temp_file.close()
-    
-    store = JsonEventStore(temp_path)
-    yield store
+    temp_path = _tmp_root / f"store{next(_counter)}.json"
+    temp_path.touch()
     
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+    return JsonEventStore(temp_path)
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing"""
-    import tempfile
-    temp = tempfile.mkdtemp()
-    yield Path(temp)
-    
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp, ignore_errors=True)
+def prepopulated_store(temp_store):
+    """Return a function that writes the given events to temp_store in one save"""
+    def _make(events):
+        temp_store._save_data({"events": [temp_store._event_to_dict(e) for e in events]})
+        return temp_store
+    return _make
+
+
+# (id, title, date) of the events in class_store
+_THREE_EVENTS = [
+    ("evt-0001", "First", _D10),
+    ("evt-0002", "Second", _D11),
+    ("evt-0003", "Third", _D12),
+]
+
+
+@pytest.fixture(scope="class")
+def class_store(_tmp_root):
+    """Create a store holding _THREE_EVENTS, shared by a class; tests must not modify it"""
+    store = JsonEventStore(_tmp_root / f"store{next(_counter)}.json")
+    store.add_many([make_event(*args) for args in _THREE_EVENTS])
+    return store
 
 
 class TestStoreInitialization:
     """Test store initialization and file creation"""
     
-    def test_store_creates_file_on_first_operation(self, temp_dir):
+    def test_store_creates_file_on_first_operation(self, tmp_path):
         """Test that store creates file when it doesn't exist"""
-        store_path = temp_dir / "new_events.json"
+        store_path = tmp_path / "new_events.json"
         assert not store_path.exists()
         
         store = JsonEventStore(store_path)
@@ -69,9 +104,9 @@ class TestStoreInitialization:
         
         assert store_path.exists()
     
-    def test_store_creates_parent_directories(self, temp_dir):
+    def test_store_creates_parent_directories(self, tmp_path):
         """Test that store creates parent directories"""
-        store_path = temp_dir / "subdir" / "events.json"
+        store_path = tmp_path / "subdir" / "events.json"
         assert not store_path.parent.exists()
         
         store = JsonEventStore(store_path)
@@ -80,9 +115,9 @@ class TestStoreInitialization:
         assert store_path.parent.exists()
         assert store_path.exists()
     
-    def test_new_file_has_correct_structure(self, temp_dir):
+    def test_new_file_has_correct_structure(self, tmp_path):
         """Test that new file has correct JSON structure"""
-        store_path = temp_dir / "events.json"
+        store_path = tmp_path / "events.json"
         store = JsonEventStore(store_path)
         store._ensure_file()
         
@@ -104,7 +139,7 @@ class TestListAll:
     
     def test_list_all_single_event(self, temp_store):
         """Test listing single event"""
-        e = make_event("evt-0001", "Test", date(2026, 2, 10))
+        e = make_event("evt-0001", "Test", _D10)
         temp_store.add(e)
         
         events = temp_store.list_all()
@@ -112,35 +147,59 @@ class TestListAll:
         assert events[0].id == "evt-0001"
         assert events[0].title == "Test"
     
-    def test_list_all_multiple_events(self, temp_store):
+    def test_list_all_multiple_events(self, class_store):
         """Test listing multiple events"""
-        e1 = make_event("evt-0001", "First", date(2026, 2, 10))
-        e2 = make_event("evt-0002", "Second", date(2026, 2, 11))
-        e3 = make_event("evt-0003", "Third", date(2026, 2, 12))
-        
-        temp_store.add(e1)
-        temp_store.add(e2)
-        temp_store.add(e3)
-        
-        events = temp_store.list_all()
+        events = class_store.list_all()
         assert len(events) == 3
     
-    def test_list_all_returns_sorted(self, temp_store):
+    def test_list_all_returns_sorted(self, temp_store, prepopulated_store):
         """Test that list_all returns events sorted by date, time, id"""
         # Add in random order
-        e1 = make_event("evt-0003", "Third", date(2026, 2, 12))
-        e2 = make_event("evt-0001", "First", date(2026, 2, 10))
-        e3 = make_event("evt-0002", "Second", date(2026, 2, 11))
+        e1 = make_event("evt-0003", "Third", _D12)
+        e2 = make_event("evt-0001", "First", _D10)
+        e3 = make_event("evt-0002", "Second", _D11)
         
-        temp_store.add(e1)
-        temp_store.add(e2)
-        temp_store.add(e3)
+        prepopulated_store([e1, e2, e3])
         
         events = temp_store.list_all()
         # Should be sorted by date
-        assert events[0].date == date(2026, 2, 10)
-        assert events[1].date == date(2026, 2, 11)
-        assert events[2].date == date(2026, 2, 12)
+        assert events[0].date == _D10
+        assert events[1].date == _D11
+        assert events[2].date == _D12
+    
+    def test_list_all_reuses_events_until_file_changes(self, temp_store):
+        """Test that unchanged content is not converted to events again"""
+        temp_store.add(make_event("evt-0001", "First", _D10))
+        
+        first = temp_store.list_all()
+        second = temp_store.list_all()
+        assert first is not second
+        assert first[0] is second[0]
+        
+        temp_store.add(make_event("evt-0002", "Second", _D11))
+        assert [e.id for e in temp_store.list_all()] == ["evt-0001", "evt-0002"]
+    
+    def test_list_all_sorts_unsorted_file(self, temp_store):
+        """Test that an unsorted file (e.g. edited by hand) is still listed in order"""
+        e1 = make_event("evt-0002", "Later", _D10)
+        e2 = make_event("evt-0001", "Earlier", _D10)
+        temp_store.path.write_text(json.dumps({"events": [
+            temp_store._event_to_dict(make_event("evt-0003", "Last", _D12)),
+            temp_store._event_to_dict(e1),
+            temp_store._event_to_dict(e2),
+        ]}))
+        
+        assert [e.id for e in temp_store.list_all()] == ["evt-0001", "evt-0002", "evt-0003"]
+    
+    def test_file_is_kept_sorted(self, temp_store):
+        """Test that saves write events in list_all order"""
+        temp_store.add(make_event("evt-0002", "Second", _D11))
+        temp_store.add(make_event("evt-0001", "First", _D10))
+        
+        with open(temp_store.path, 'r') as f:
+            data = json.load(f)
+        
+        assert [e["id"] for e in data["events"]] == ["evt-0001", "evt-0002"]
 
 
 class TestGetById:
@@ -148,7 +207,7 @@ class TestGetById:
     
     def test_get_by_id_found(self, temp_store):
         """Test getting event by ID when it exists"""
-        e = make_event("evt-1234", "Test", date(2026, 2, 10))
+        e = make_event("evt-1234", "Test", _D10)
         temp_store.add(e)
         
         result = temp_store.get_by_id("evt-1234")
@@ -166,20 +225,14 @@ class TestGetById:
         result = temp_store.get_by_id("evt-0001")
         assert result is None
     
-    def test_get_by_id_with_multiple_events(self, temp_store):
+    @pytest.mark.parametrize("event_id,title,d", _THREE_EVENTS)
+    def test_get_by_id_with_multiple_events(self, class_store, event_id, title, d):
         """Test getting specific event from multiple events"""
-        e1 = make_event("evt-0001", "First", date(2026, 2, 10))
-        e2 = make_event("evt-0002", "Second", date(2026, 2, 11))
-        e3 = make_event("evt-0003", "Third", date(2026, 2, 12))
-        
-        temp_store.add(e1)
-        temp_store.add(e2)
-        temp_store.add(e3)
-        
-        result = temp_store.get_by_id("evt-0002")
+        result = class_store.get_by_id(event_id)
         assert result is not None
-        assert result.id == "evt-0002"
-        assert result.title == "Second"
+        assert result.id == event_id
+        assert result.title == title
+        assert result.date == d
 
 
 class TestAdd:
@@ -187,7 +240,7 @@ class TestAdd:
     
     def test_add_single_event(self, temp_store):
         """Test adding single event"""
-        e = make_event("evt-0001", "Test", date(2026, 2, 10))
+        e = make_event("evt-0001", "Test", _D10)
         temp_store.add(e)
         
         # Verify it was added
@@ -197,17 +250,17 @@ class TestAdd:
     
     def test_add_duplicate_id_raises_error(self, temp_store):
         """Test that adding duplicate ID raises error"""
-        e1 = make_event("evt-0001", "First", date(2026, 2, 10))
-        e2 = make_event("evt-0001", "Second", date(2026, 2, 11))
+        e1 = make_event("evt-0001", "First", _D10)
+        e2 = make_event("evt-0001", "Second", _D11)
         
         temp_store.add(e1)
         
-        with pytest.raises(StorageError, match="already exists"):
+        with pytest.raises(StorageError, match=_ERR_EXISTS):
             temp_store.add(e2)
     
     def test_add_persists_to_file(self, temp_store):
         """Test that add persists data to file"""
-        e = make_event("evt-0001", "Test", date(2026, 2, 10))
+        e = make_event("evt-0001", "Test", _D10)
         temp_store.add(e)
         
         # Read file directly
@@ -223,7 +276,7 @@ class TestAdd:
             id="evt-0001",
             title="Meeting",
             description="Important meeting",
-            date=date(2026, 2, 10),
+            date=_D10,
             start_time="14:30",
             duration_min=90,
             location="Room 101",
@@ -236,7 +289,7 @@ class TestAdd:
         
         assert retrieved.title == "Meeting"
         assert retrieved.description == "Important meeting"
-        assert retrieved.date == date(2026, 2, 10)
+        assert retrieved.date == _D10
         assert retrieved.start_time == "14:30"
         assert retrieved.duration_min == 90
         assert retrieved.location == "Room 101"
@@ -252,7 +305,7 @@ class TestAddMany:
     
     def test_add_many_single_event(self, temp_store):
         """Test adding single event via add_many"""
-        e = make_event("evt-0001", "Test", date(2026, 2, 10))
+        e = make_event("evt-0001", "Test", _D10)
         temp_store.add_many([e])
         
         events = temp_store.list_all()
@@ -261,9 +314,9 @@ class TestAddMany:
     def test_add_many_multiple_events(self, temp_store):
         """Test adding multiple events"""
         events = [
-            make_event("evt-0001", "First", date(2026, 2, 10)),
-            make_event("evt-0002", "Second", date(2026, 2, 11)),
-            make_event("evt-0003", "Third", date(2026, 2, 12)),
+            make_event("evt-0001", "First", _D10),
+            make_event("evt-0002", "Second", _D11),
+            make_event("evt-0003", "Third", _D12),
         ]
         
         temp_store.add_many(events)
@@ -271,25 +324,38 @@ class TestAddMany:
         result = temp_store.list_all()
         assert len(result) == 3
     
+    def test_add_many_writes_once(self, temp_store, monkeypatch):
+        """Test that a batch is saved with a single write"""
+        saves = []
+        real_save = temp_store._save_data
+        monkeypatch.setattr(temp_store, "_save_data", lambda data: saves.append(1) or real_save(data))
+        
+        temp_store.add_many([
+            make_event(f"evt-000{n}", f"Event {n}", _D10) for n in range(1, 4)
+        ])
+        
+        assert saves == [1]
+        assert len(temp_store.list_all()) == 3
+    
     def test_add_many_with_duplicate_raises_error(self, temp_store):
         """Test that duplicate IDs in batch raise error"""
         events = [
-            make_event("evt-0001", "First", date(2026, 2, 10)),
-            make_event("evt-0001", "Duplicate", date(2026, 2, 11)),
+            make_event("evt-0001", "First", _D10),
+            make_event("evt-0001", "Duplicate", _D11),
         ]
         
-        with pytest.raises(StorageError, match="Duplicate event id"):
+        with pytest.raises(StorageError, match=_ERR_DUP):
             temp_store.add_many(events)
     
     def test_add_many_atomic_on_error(self, temp_store):
         """Test that add_many is atomic (all or nothing)"""
         # Add one event first
-        temp_store.add(make_event("evt-0001", "Existing", date(2026, 2, 10)))
+        temp_store.add(make_event("evt-0001", "Existing", _D10))
         
         # Try to add batch with duplicate
         events = [
-            make_event("evt-0002", "New1", date(2026, 2, 11)),
-            make_event("evt-0001", "Duplicate", date(2026, 2, 12)),  # Duplicate!
+            make_event("evt-0002", "New1", _D11),
+            make_event("evt-0001", "Duplicate", _D12),  # Duplicate!
         ]
         
         with pytest.raises(StorageError):
@@ -306,7 +372,7 @@ class TestUpdate:
     
     def test_update_existing_event(self, temp_store):
         """Test updating existing event"""
-        e = make_event("evt-0001", "Original", date(2026, 2, 10))
+        e = make_event("evt-0001", "Original", _D10)
         temp_store.add(e)
         
         # Update with new data
@@ -314,7 +380,7 @@ class TestUpdate:
             id="evt-0001",
             title="Updated",
             description="New description",
-            date=date(2026, 2, 11),
+            date=_D11,
             start_time="15:00",
             duration_min=45,
             location="New location",
@@ -327,26 +393,26 @@ class TestUpdate:
         # Verify update
         result = temp_store.get_by_id("evt-0001")
         assert result.title == "Updated"
-        assert result.date == date(2026, 2, 11)
+        assert result.date == _D11
         assert result.duration_min == 45
     
     def test_update_nonexistent_raises_error(self, temp_store):
         """Test updating non-existent event raises error"""
-        e = make_event("evt-9999", "Test", date(2026, 2, 10))
+        e = make_event("evt-9999", "Test", _D10)
         
-        with pytest.raises(StorageError, match="not found"):
+        with pytest.raises(StorageError, match=_ERR_NOT_FOUND):
             temp_store.update(e)
     
     def test_update_persists_to_file(self, temp_store):
         """Test that update persists to file"""
-        e = make_event("evt-0001", "Original", date(2026, 2, 10))
+        e = make_event("evt-0001", "Original", _D10)
         temp_store.add(e)
         
         updated = Event(
             id="evt-0001",
             title="Updated",
             description=None,
-            date=date(2026, 2, 10),
+            date=_D10,
             start_time="10:00",
             duration_min=60,
             location=None,
@@ -368,7 +434,7 @@ class TestDeleteById:
     
     def test_delete_existing_event(self, temp_store):
         """Test deleting existing event"""
-        e = make_event("evt-0001", "Test", date(2026, 2, 10))
+        e = make_event("evt-0001", "Test", _D10)
         temp_store.add(e)
         
         result = temp_store.delete_by_id("evt-0001")
@@ -382,15 +448,13 @@ class TestDeleteById:
         result = temp_store.delete_by_id("evt-9999")
         assert result is False
     
-    def test_delete_from_multiple_events(self, temp_store):
+    def test_delete_from_multiple_events(self, temp_store, prepopulated_store):
         """Test deleting one event from multiple"""
-        e1 = make_event("evt-0001", "First", date(2026, 2, 10))
-        e2 = make_event("evt-0002", "Second", date(2026, 2, 11))
-        e3 = make_event("evt-0003", "Third", date(2026, 2, 12))
+        e1 = make_event("evt-0001", "First", _D10)
+        e2 = make_event("evt-0002", "Second", _D11)
+        e3 = make_event("evt-0003", "Third", _D12)
         
-        temp_store.add(e1)
-        temp_store.add(e2)
-        temp_store.add(e3)
+        prepopulated_store([e1, e2, e3])
         
         temp_store.delete_by_id("evt-0002")
         
@@ -399,9 +463,19 @@ class TestDeleteById:
         assert events[0].id == "evt-0001"
         assert events[1].id == "evt-0003"
     
+    def test_lookups_after_delete(self, temp_store, prepopulated_store):
+        """Test that events behind a deleted one are still found by id"""
+        prepopulated_store([make_event(f"evt-000{n}", f"Event {n}", _D10) for n in range(1, 4)])
+        
+        temp_store.delete_by_id("evt-0001")
+        
+        assert temp_store.get_by_id("evt-0003").title == "Event 3"
+        assert temp_store.delete_by_id("evt-0002") is True
+        assert [e.id for e in temp_store.list_all()] == ["evt-0003"]
+    
     def test_delete_persists_to_file(self, temp_store):
         """Test that delete persists to file"""
-        e = make_event("evt-0001", "Test", date(2026, 2, 10))
+        e = make_event("evt-0001", "Test", _D10)
         temp_store.add(e)
         
         temp_store.delete_by_id("evt-0001")
@@ -418,7 +492,7 @@ class TestDeleteByDate:
     
     def test_delete_by_date_single_event(self, temp_store):
         """Test deleting single event by date"""
-        e = make_event("evt-0001", "Test", date(2026, 2, 10))
+        e = make_event("evt-0001", "Test", _D10)
         temp_store.add(e)
         
         deleted = temp_store.delete_by_date("2026-02-10")
@@ -427,26 +501,24 @@ class TestDeleteByDate:
         events = temp_store.list_all()
         assert len(events) == 0
     
-    def test_delete_by_date_multiple_events(self, temp_store):
+    def test_delete_by_date_multiple_events(self, temp_store, prepopulated_store):
         """Test deleting multiple events on same date"""
-        e1 = make_event("evt-0001", "First", date(2026, 2, 10))
-        e2 = make_event("evt-0002", "Second", date(2026, 2, 10))
-        e3 = make_event("evt-0003", "Third", date(2026, 2, 11))
+        e1 = make_event("evt-0001", "First", _D10)
+        e2 = make_event("evt-0002", "Second", _D10)
+        e3 = make_event("evt-0003", "Third", _D11)
         
-        temp_store.add(e1)
-        temp_store.add(e2)
-        temp_store.add(e3)
+        prepopulated_store([e1, e2, e3])
         
         deleted = temp_store.delete_by_date("2026-02-10")
         assert deleted == 2
         
         events = temp_store.list_all()
         assert len(events) == 1
-        assert events[0].date == date(2026, 2, 11)
+        assert events[0].date == _D11
     
     def test_delete_by_date_no_matches(self, temp_store):
         """Test deleting when no events on that date"""
-        e = make_event("evt-0001", "Test", date(2026, 2, 10))
+        e = make_event("evt-0001", "Test", _D10)
         temp_store.add(e)
         
         deleted = temp_store.delete_by_date("2026-02-15")
@@ -462,7 +534,7 @@ class TestFileOperations:
     
     def test_atomic_write_with_temp_file(self, temp_store):
         """Test that writes use temporary file (atomic operation)"""
-        e = make_event("evt-0001", "Test", date(2026, 2, 10))
+        e = make_event("evt-0001", "Test", _D10)
         
         # Mock to verify temp file is used
         original_save = temp_store._save_data
@@ -479,35 +551,91 @@ class TestFileOperations:
         
         assert len(temp_file_used) > 0
     
-    def test_handle_corrupted_json(self, temp_dir):
+    def test_handle_corrupted_json(self, tmp_path):
         """Test handling corrupted JSON file"""
-        store_path = temp_dir / "corrupted.json"
+        store_path = tmp_path / "corrupted.json"
         store_path.write_text("{ invalid json")
         
         store = JsonEventStore(store_path)
         
-        with pytest.raises(StorageError, match="Failed to parse JSON"):
+        with pytest.raises(StorageError, match=_ERR_PARSE):
             store.list_all()
     
-    def test_handle_invalid_structure(self, temp_dir):
+    def test_handle_invalid_structure(self, tmp_path):
         """Test handling invalid JSON structure"""
-        store_path = temp_dir / "invalid.json"
+        store_path = tmp_path / "invalid.json"
         store_path.write_text('{"wrong": "structure"}')
         
         store = JsonEventStore(store_path)
         
-        with pytest.raises(StorageError, match="Invalid data format"):
+        with pytest.raises(StorageError, match=_ERR_FORMAT):
             store.list_all()
     
-    def test_handle_empty_file(self, temp_dir):
+    def test_handle_empty_file(self, tmp_path):
         """Test handling empty file"""
-        store_path = temp_dir / "empty.json"
+        store_path = tmp_path / "empty.json"
         store_path.write_text("")
         
         store = JsonEventStore(store_path)
         events = store.list_all()
         
         assert events == []
+    
+    def test_fsync_knob(self, tmp_path, monkeypatch):
+        """Test that saves are only fsynced when the store opts in"""
+        synced = []
+        monkeypatch.setattr("calctl.store.os.fsync", synced.append)
+        
+        JsonEventStore(tmp_path / "fast.json").add(make_event("evt-0001", "A", _D10))
+        assert synced == []
+        
+        JsonEventStore(tmp_path / "durable.json", fsync=True).add(make_event("evt-0001", "A", _D10))
+        assert len(synced) == 1
+    
+    def test_revision_changes_on_write(self, temp_store):
+        """Test that every save produces a new revision token"""
+        temp_store.add(make_event("evt-0001", "First", _D10))
+        before = temp_store.revision()
+        
+        temp_store.add(make_event("evt-0002", "Second", _D11))
+        
+        assert before is not None
+        assert temp_store.revision() != before
+    
+    def test_revision_none_for_missing_file(self, tmp_path):
+        """Test that a store without a data file has no revision"""
+        store = JsonEventStore(tmp_path / "missing.json")
+        
+        assert store.revision() is None
+    
+    def test_reads_are_cached_until_file_changes(self, temp_store, monkeypatch):
+        """Test that unchanged files are parsed once and external rewrites are picked up"""
+        temp_store.add(make_event("evt-0001", "First", _D10))
+        calls = []
+        real_read = temp_store._read_file
+        monkeypatch.setattr(temp_store, "_read_file", lambda: calls.append(1) or real_read())
+        
+        temp_store.list_all()
+        temp_store.get_by_id("evt-0001")
+        assert calls == []
+        
+        other = JsonEventStore(temp_store.path)
+        other.add(make_event("evt-0002", "Second", _D11))
+        
+        assert [e.id for e in temp_store.list_all()] == ["evt-0001", "evt-0002"]
+        assert calls == [1]
+    
+    def test_round_trip_without_orjson(self, temp_store, monkeypatch):
+        """Test that the stdlib json fallback reads and writes the same data"""
+        monkeypatch.setattr("calctl.store.orjson", None)
+        e = make_event("evt-0001", "Café", _D10)
+        
+        temp_store.add(e)
+        
+        with open(temp_store.path, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["events"][0]["title"] == "Café"
+        assert temp_store.list_all() == [e]
 
 
 class TestEventSerialization:
@@ -519,7 +647,7 @@ class TestEventSerialization:
             id="evt-0001",
             title="Meeting",
             description="Important",
-            date=date(2026, 2, 10),
+            date=_D10,
             start_time="14:30",
             duration_min=90,
             location="Room 101",
@@ -556,7 +684,7 @@ class TestEventSerialization:
         assert e.id == "evt-0001"
         assert e.title == "Meeting"
         assert e.description == "Important"
-        assert e.date == date(2026, 2, 10)
+        assert e.date == _D10
         assert e.start_time == "14:30"
         assert e.duration_min == 90
         assert e.location == "Room 101"
@@ -571,5 +699,5 @@ class TestEventSerialization:
             "duration_min": 90,
         }
         
-        with pytest.raises(StorageError, match="Missing required field"):
+        with pytest.raises(StorageError, match=_ERR_MISSING):
             temp_store._event_from_dict(d)
\ No newline at end of file